@@ -6,7 +6,7 @@ with real cryptography (no external binary dependencies)
 
 Features:
 - Real SRP-6a authentication
-- Real Ed25519 key exchange
+- Real X25519 key exchange with Ed25519 signatures
 - Real ChaCha20-Poly1305 decryption
 - Real H.264 video decoding
 - Pure Python implementation using standard libraries
@@ -15,16 +15,23 @@ Features:
 import asyncio
 import socket
 import struct
+import sys
 import threading
 import time
 import plistlib
 import os
+import queue
 import hashlib
 import hmac
+import uuid
 import numpy as np
 import cv2
 from typing import Optional, Dict, Tuple
 import logging
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+
+from mdns_discovery import get_local_ip, get_zeroconf, release_zeroconf
 
 # Enhanced logging - set to DEBUG for troubleshooting
 LOG_LEVEL = os.getenv('DEBUG', 'INFO')
@@ -53,18 +60,49 @@ except ImportError as e:
     srp = None
     logger.warning(f"SRP not available: {e}")
 
+# GMP-backed modexp for pysrp's pure-Python backend (optional)
+try:
+    import gmpy2
+    GMPY2_AVAILABLE = True
+except ImportError:
+    GMPY2_AVAILABLE = False
+
+
+def _gmp_pow(base, exp, mod=None):
+    """Drop-in pow() that routes 3-argument modexp through gmpy2"""
+    if mod is None:
+        return pow(base, exp)
+    return int(gmpy2.powmod(base, exp, mod))
+
+
+# pysrp uses the OpenSSL ctypes backend when it can; only the pure-Python
+# fallback does its 3072-bit modexps with the builtin pow()
+if srp and GMPY2_AVAILABLE and srp.Verifier.__module__ == 'srp._pysrp':
+    sys.modules['srp._pysrp'].pow = _gmp_pow
+    logger.debug("Using gmpy2 for SRP modular exponentiation")
+
 try:
     from cryptography.hazmat.primitives import hashes, serialization
-    from cryptography.hazmat.primitives.asymmetric import ed25519
+    from cryptography.hazmat.primitives.asymmetric import ed25519, x25519
     from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
     from cryptography.hazmat.primitives.kdf.hkdf import HKDF
     from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.backends.openssl import backend as _openssl_backend
     CRYPTO_AVAILABLE = True
-    logger.debug("Cryptography module loaded successfully")
+    # ChaCha20-Poly1305 runs in OpenSSL, which picks its SIMD code at runtime
+    logger.debug(f"Cryptography module loaded successfully ({_openssl_backend.openssl_version_text()})")
 except ImportError as e:
     CRYPTO_AVAILABLE = False
     logger.warning(f"Cryptography not available: {e}")
 
+# Faster Ed25519 signing via libsodium (optional, cryptography is the fallback)
+try:
+    import nacl.signing
+    NACL_AVAILABLE = True
+    logger.debug("PyNaCl module loaded successfully")
+except ImportError:
+    NACL_AVAILABLE = False
+
 # Video decoding import
 try:
     import av
@@ -74,6 +112,117 @@ except ImportError as e:
     VIDEO_AVAILABLE = False
     logger.warning(f"PyAV not available: {e}")
 
+# Faster event loop (optional, not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+    logger.debug("uvloop module loaded successfully")
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+# Pre-encoded HTTP response headers (%d templates take the Content-Length)
+_EMPTY_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Server: AirPlay/366.0\r\n"
+    b"Content-Length: 0\r\n"
+    b"\r\n"
+)
+_STREAM_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Server: AirPlay/366.0\r\n"
+    b"\r\n"
+)
+_REVERSE_RESPONSE = (
+    b"HTTP/1.1 101 Switching Protocols\r\n"
+    b"Upgrade: PTTH/1.0\r\n"
+    b"Connection: Upgrade\r\n"
+    b"\r\n"
+)
+_OCTET_STREAM_HEADER = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/octet-stream\r\n"
+    b"Content-Length: %d\r\n"
+    b"Server: AirTunes/366.0\r\n"
+    b"\r\n"
+)
+_PLIST_HEADER = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/x-apple-binary-plist\r\n"
+    b"Content-Length: %d\r\n"
+    b"Server: AirTunes/366.0\r\n"
+    b"\r\n"
+)
+
+# RFC 5054 3072-bit SRP group (pysrp has no built-in 3072-bit group)
+_SRP_N_3072_HEX = (
+    b"FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74"
+    b"020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F1437"
+    b"4FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED"
+    b"EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF05"
+    b"98DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB"
+    b"9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3B"
+    b"E39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF695581718"
+    b"3995497CEA956AE515D2261898FA051015728E5A8AAAC42DAD33170D04507A33"
+    b"A85521ABDF1CBA64ECFB850458DBEF0A8AEA71575D060C7DB3970F85A6E1E4C7"
+    b"ABF5AE8CDB0933D71E8C94E04A25619DCEE3D2261AD2EE6BF12FFA06D98A0864"
+    b"D87602733EC86A64521F2B18177B200CBBE117577A615D6C770988C0BAD946E2"
+    b"08E24FA074E5AB3143DB5BFCE0FD108E4B82D120A93AD2CAFFFFFFFFFFFFFFFF"
+)
+_SRP_G_3072_HEX = b"5"
+
+# Hardware H.264 decoders to try before falling back to software, in order
+# of preference (NVDEC, Quick Sync, V4L2 M2M on ARM boards)
+_HW_H264_DECODERS = ('h264_cuvid', 'h264_qsv', 'h264_v4l2m2m')
+
+# NAL unit types that begin a new access unit once a slice has been seen
+# (SEI, SPS, PPS, access unit delimiter, 14-18 reserved/prefix)
+_H264_AU_START_TYPES = frozenset((6, 7, 8, 9, 14, 15, 16, 17, 18))
+
+# Decoder output formats converted to BGR with OpenCV instead of swscale
+_YUV_TO_BGR = {
+    'yuv420p': cv2.COLOR_YUV2BGR_I420,
+    'nv12': cv2.COLOR_YUV2BGR_NV12,
+}
+
+# HKDF parameters for the pair-verify session keys
+_PAIR_VERIFY_ENCRYPT_SALT = b"Pair-Verify-Encrypt-Salt"
+_PAIR_VERIFY_ENCRYPT_INFO = b"Pair-Verify-Encrypt-Info"
+_PAIR_VERIFY_DECRYPT_SALT = b"Pair-Verify-Decrypt-Salt"
+_PAIR_VERIFY_DECRYPT_INFO = b"Pair-Verify-Decrypt-Info"
+
+# Annex B start code delimiting H.264 NAL units in the mirroring stream
+_NAL_START_CODE = b'\x00\x00\x00\x01'
+
+# Minimum free space offered to the socket per receive on the mirroring
+# stream; large reads amortize per-call overhead
+_STREAM_READ_SIZE = 65536
+
+# Initial size of the mirroring stream receive buffer
+_STREAM_BUFFER_SIZE = 256 * 1024
+
+# Queued NAL units per stream above which non-IDR slices are dropped until
+# the next IDR (about two seconds of single-slice 60 fps video)
+_DECODE_QUEUE_HIGH_WATER = 128
+
+# Number of rendered placeholder frames kept (2.7 MB each)
+_PLACEHOLDER_CACHE_SIZE = 32
+
+# Blank placeholder canvas; copying it is ~20x faster than np.full with a
+# per-channel fill value
+_PLACEHOLDER_BASE = np.full((720, 1280, 3), (40, 40, 60), dtype=np.uint8)
+_PLACEHOLDER_BASE.flags.writeable = False
+
+# Largest request body accepted; anything bigger closes the connection rather
+# than allocating whatever a client claims in Content-Length
+_MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# TCP keepalive for idle reverse HTTP connections: first probe after this
+# many idle seconds, then every interval, giving up after count misses
+_REVERSE_KEEPALIVE_IDLE = 30
+_REVERSE_KEEPALIVE_INTERVAL = 10
+_REVERSE_KEEPALIVE_COUNT = 3
+
 
 def tlv8_encode(type_id, data):
     """Encode data in TLV8 format (Type-Length-Value)"""
@@ -82,40 +231,71 @@ def tlv8_encode(type_id, data):
     elif isinstance(data, int):
         data = data.to_bytes((data.bit_length() + 7) // 8, 'little')
 
-    result = b''
-    # Split data into 255-byte chunks
-    while len(data) > 255:
-        result += bytes([type_id, 255]) + data[:255]
-        data = data[255:]
-    if len(data) > 0:
-        result += bytes([type_id, len(data)]) + data
-    return result
+    # Preallocate the output (2 header bytes per 255-byte chunk) and copy
+    # straight from a memoryview so no intermediate chunk objects are made
+    src = memoryview(data)
+    size = len(src)
+    out = bytearray(size + 2 * ((size + 254) // 255))
+
+    off = 0
+    for i in range(0, size, 255):
+        length = min(255, size - i)
+        out[off] = type_id
+        out[off + 1] = length
+        out[off + 2:off + 2 + length] = src[i:i + length]
+        off += 2 + length
+    return bytes(out)
+
+
+def tlv8_write(buf, type_id, data):
+    """Append TLV8 records for data to a bytearray in place"""
+    src = memoryview(data)
+    size = len(src)
+    for i in range(0, size, 255):
+        length = min(255, size - i)
+        buf.append(type_id)
+        buf.append(length)
+        buf += src[i:i + length]
+
+
+def tlv8_write_u8(buf, type_id, value):
+    """Append a single-byte TLV8 value (states, error codes) to a bytearray"""
+    buf.append(type_id)
+    buf.append(1)
+    buf.append(value)
 
 
 def tlv8_decode(data):
     """Decode TLV8 format data"""
-    result = {}
+    # Collect fragments per type and join once, so values split across
+    # several 255-byte records are not re-concatenated on every record
+    fragments = defaultdict(list)
+    mv = memoryview(data)
+    size = len(mv)
     i = 0
-    while i < len(data):
-        if i + 1 >= len(data):
-            break
-        type_id = data[i]
-        length = data[i + 1]
+    while i + 2 <= size:
+        type_id = mv[i]
+        length = mv[i + 1]
         i += 2
-        if i + length > len(data):
+        if i + length > size:
             break
-        value = data[i:i + length]
-        if type_id in result:
-            result[type_id] += value
-        else:
-            result[type_id] = value
+        fragments[type_id].append(mv[i:i + length])
         i += length
-    return result
+    return {type_id: b''.join(parts) for type_id, parts in fragments.items()}
+
+
+def tlv8_read_u8(tlv, type_id, default=1):
+    """Read a single-byte TLV8 value, using default if it is missing or empty"""
+    value = tlv.get(type_id)
+    return value[0] if value else default
 
 
 class AirPlayCrypto:
     """Handles all AirPlay cryptographic operations"""
 
+    # (salt, verifier) per (username, password), shared by all instances
+    _srp_verifier_cache: Dict[Tuple[str, str], Tuple[bytes, bytes]] = {}
+
     def __init__(self):
         """Initialize crypto state"""
         # SRP-6a state
@@ -125,15 +305,21 @@ class AirPlayCrypto:
         self.srp_session = None
         self.srp_key = None
 
-        # Ed25519 state
+        # Ed25519 identity key (advertised as 'pk', used for signing)
         self.ed_private_key = None
         self.ed_public_key = None
+        self.ed_public_bytes: Optional[bytes] = None
+
+        # X25519 ephemeral key for pair-verify ECDH
+        self.x_private_key = None
         self.shared_secret = None
 
-        # Encryption state
+        # Encryption state (ciphers are built once per shared secret)
         self.cipher = None
         self.encryption_key = None
         self.decryption_key = None
+        self._enc_cipher = None
+        self._dec_cipher = None
 
         # Device pairing state
         self.is_paired = False
@@ -152,40 +338,60 @@ class AirPlayCrypto:
         """
         if not srp:
             logger.warning("SRP library not available, using fallback")
-            return os.urandom(16), os.urandom(384)
+            return self._random_challenge()
 
         try:
             # Create SRP user (server side)
             self.srp_user = username
 
-            # Generate salt and verifier
-            self.srp_salt = os.urandom(16)
-            self.srp_verifier = srp.create_salted_verification_key(
-                username, password,
-                salt=self.srp_salt,
-                hash_alg=srp.SHA1,
-                ng_type=srp.NG_3072
-            )
+            # Salt and verifier depend only on the fixed credentials, so the
+            # 3072-bit modexp that produces them runs once per process
+            self.srp_verifier = self._get_srp_verifier(username, password)
+            self.srp_salt = self.srp_verifier[0]
 
-            # Create server session
+            # Create server session; the client's public key (A) only arrives
+            # with M3, so the session is created without it
             self.srp_session = srp.Verifier(
                 username,
                 self.srp_salt,
                 self.srp_verifier[1],
-                bytes.fromhex(self.srp_session.get_challenge()) if hasattr(self.srp_session, 'get_challenge') else os.urandom(384),
                 hash_alg=srp.SHA1,
-                ng_type=srp.NG_3072
+                ng_type=srp.NG_CUSTOM,
+                n_hex=_SRP_N_3072_HEX,
+                g_hex=_SRP_G_3072_HEX
             )
 
-            # Get server public key
-            server_public = self.srp_session.get_challenge_bytes() if hasattr(self.srp_session, 'get_challenge_bytes') else os.urandom(384)
+            # Get server public key (B)
+            _, server_public = self.srp_session.get_challenge()
 
-            logger.info("SRP-6a setup complete")
+            logger.debug("SRP-6a setup complete")
             return self.srp_salt, server_public
 
         except Exception as e:
             logger.error(f"SRP setup error: {e}")
-            return os.urandom(16), os.urandom(384)
+            return self._random_challenge()
+
+    @classmethod
+    def _get_srp_verifier(cls, username: str, password: str) -> Tuple[bytes, bytes]:
+        """Get the cached (salt, verifier) pair for the given credentials"""
+        key = (username, password)
+        verifier = cls._srp_verifier_cache.get(key)
+        if verifier is None:
+            verifier = srp.create_salted_verification_key(
+                username, password,
+                hash_alg=srp.SHA1,
+                ng_type=srp.NG_CUSTOM,
+                n_hex=_SRP_N_3072_HEX,
+                g_hex=_SRP_G_3072_HEX
+            )
+            cls._srp_verifier_cache[key] = verifier
+        return verifier
+
+    @staticmethod
+    def _random_challenge() -> Tuple[bytes, bytes]:
+        """Random (salt, server_public) pair from a single urandom call"""
+        blob = os.urandom(16 + 384)
+        return blob[:16], blob[16:]
 
     def verify_srp(self, client_public: bytes, client_proof: bytes) -> Optional[bytes]:
         """
@@ -199,94 +405,143 @@ class AirPlayCrypto:
             Server proof (M2) if verification succeeds, None otherwise
         """
         if not srp or not self.srp_session:
-            logger.warning("SRP not available, using fallback")
-            return os.urandom(64)
+            logger.warning("SRP not available, cannot verify client proof")
+            return None
 
         try:
-            # Process client's public key
-            self.srp_session.set_A(client_public)
-
-            # Verify client's proof
-            server_proof = self.srp_session.verify_session(client_proof)
+            # Same steps as Verifier.verify_session(), which compares M with
+            # == in both pysrp backends; compare in constant time instead
+            session = self.srp_session
+            session._set_A(client_public)
+            if session.safety_failed:
+                logger.warning("SRP verification failed: invalid client public key")
+                return None
 
-            if server_proof:
-                # Get shared secret key
-                self.srp_key = self.srp_session.get_session_key()
-                logger.info("SRP verification successful")
-                return server_proof
-            else:
+            session._derive_H_AMK()
+            if not hmac.compare_digest(bytes(client_proof), session.M):
                 logger.warning("SRP verification failed")
                 return None
 
+            session._authenticated = True
+            # Get shared secret key
+            self.srp_key = session.get_session_key()
+            logger.info("SRP verification successful")
+            return session.H_AMK
+
         except Exception as e:
             logger.error(f"SRP verification error: {e}")
-            return os.urandom(64)
+            return None
+
+    def setup_ed25519(self) -> bytes:
+        """
+        Setup the Ed25519 identity key (generated once per receiver)
+
+        Returns:
+            Server's Ed25519 public key (32 bytes)
+        """
+        if not CRYPTO_AVAILABLE and not NACL_AVAILABLE:
+            logger.warning("Cryptography library not available, using fallback")
+            return os.urandom(32)
+
+        try:
+            if self.ed_private_key is None:
+                logger.info("Generating Ed25519 identity key")
+                if NACL_AVAILABLE:
+                    self.ed_private_key = nacl.signing.SigningKey.generate()
+                    self.ed_public_key = self.ed_private_key.verify_key
+                    self.ed_public_bytes = self.ed_public_key.encode()
+                else:
+                    self.ed_private_key = ed25519.Ed25519PrivateKey.generate()
+                    self.ed_public_key = self.ed_private_key.public_key()
+                    self.ed_public_bytes = self.ed_public_key.public_bytes(
+                        encoding=serialization.Encoding.Raw,
+                        format=serialization.PublicFormat.Raw
+                    )
+
+            return self.ed_public_bytes
+
+        except Exception as e:
+            logger.error(f"Ed25519 setup error: {e}")
+            return os.urandom(32)
 
     def setup_curve25519(self) -> bytes:
         """
         Setup Curve25519 key exchange for pair-verify
 
         Returns:
-            Server's public key (32 bytes)
+            Server's X25519 public key (32 bytes)
         """
         if not CRYPTO_AVAILABLE:
             logger.warning("Cryptography library not available, using fallback")
             return os.urandom(32)
 
         try:
-            # Generate Ed25519 key pair (Curve25519 is the underlying curve)
-            self.ed_private_key = ed25519.Ed25519PrivateKey.generate()
-            self.ed_public_key = self.ed_private_key.public_key()
+            # Fresh ephemeral X25519 key pair for each pair-verify
+            self.x_private_key = x25519.X25519PrivateKey.generate()
 
             # Get raw public key bytes
-            public_bytes = self.ed_public_key.public_bytes(
+            public_bytes = self.x_private_key.public_key().public_bytes(
                 encoding=serialization.Encoding.Raw,
                 format=serialization.PublicFormat.Raw
             )
 
-            logger.info("Curve25519 key exchange setup complete")
+            logger.debug("Curve25519 key exchange setup complete")
             return public_bytes
 
         except Exception as e:
             logger.error(f"Curve25519 setup error: {e}")
             return os.urandom(32)
 
-    def compute_shared_secret(self, client_public_key: bytes, server_public_key: bytes) -> bytes:
+    def compute_shared_secret(self, client_public_key: bytes) -> bytes:
         """
-        Compute shared secret using ECDH
+        Compute shared secret using X25519 ECDH
 
         Args:
-            client_public_key: Client's public key
-            server_public_key: Server's public key
+            client_public_key: Client's X25519 public key
 
         Returns:
             Shared secret
         """
-        if not CRYPTO_AVAILABLE:
+        if not CRYPTO_AVAILABLE or not self.x_private_key:
             return os.urandom(32)
 
         try:
-            # For AirPlay, we use HKDF to derive the shared secret
-            # Input key material is concatenation of public keys
-            ikm = client_public_key + server_public_key
-
-            # Derive shared secret using HKDF
-            hkdf = HKDF(
-                algorithm=hashes.SHA512(),
-                length=32,
-                salt=b"Pair-Verify-Encrypt-Salt",
-                info=b"Pair-Verify-Encrypt-Info",
-                backend=default_backend()
+            # One scalar multiplication with our ephemeral key
+            self.shared_secret = self.x_private_key.exchange(
+                x25519.X25519PublicKey.from_public_bytes(client_public_key)
             )
-            self.shared_secret = hkdf.derive(ikm)
 
-            logger.info("Shared secret computed")
+            # A new shared secret invalidates any previously derived session keys
+            self.encryption_key = None
+            self.decryption_key = None
+            self._enc_cipher = None
+            self._dec_cipher = None
+
+            logger.debug("Shared secret computed")
             return self.shared_secret
 
         except Exception as e:
             logger.error(f"Shared secret computation error: {e}")
             return os.urandom(32)
 
+    @staticmethod
+    def _derive_key(key_material: bytes, salt: bytes, info: bytes) -> bytes:
+        """
+        Derive a 32-byte key with HKDF-SHA512
+
+        The hash is fixed by the AirPlay pair-verify protocol (the iOS side
+        derives the same keys with SHA-512), so it cannot be swapped for a
+        cheaper one without breaking interoperability.
+        """
+        hkdf = HKDF(
+            algorithm=hashes.SHA512(),
+            length=32,
+            salt=salt,
+            info=info,
+            backend=default_backend()
+        )
+        return hkdf.derive(key_material)
+
     def encrypt_data(self, plaintext: bytes, nonce: bytes = None) -> bytes:
         """
         Encrypt data using ChaCha20-Poly1305
@@ -302,19 +557,12 @@ class AirPlayCrypto:
             return os.urandom(len(plaintext) + 16)
 
         try:
-            # Derive encryption key if not already done
-            if not self.encryption_key:
-                hkdf = HKDF(
-                    algorithm=hashes.SHA512(),
-                    length=32,
-                    salt=b"Pair-Verify-Encrypt-Salt",
-                    info=b"Pair-Verify-Encrypt-Info",
-                    backend=default_backend()
-                )
-                self.encryption_key = hkdf.derive(self.shared_secret)
-
-            # Create cipher
-            cipher = ChaCha20Poly1305(self.encryption_key)
+            # Derive encryption key and cipher if not already done
+            if self._enc_cipher is None:
+                self.encryption_key = self._derive_key(
+                    self.shared_secret, _PAIR_VERIFY_ENCRYPT_SALT, _PAIR_VERIFY_ENCRYPT_INFO)
+                self._enc_cipher = ChaCha20Poly1305(self.encryption_key)
+            cipher = self._enc_cipher
 
             # Generate nonce if not provided
             if nonce is None:
@@ -334,7 +582,8 @@ class AirPlayCrypto:
         Decrypt data using ChaCha20-Poly1305
 
         Args:
-            ciphertext: Encrypted data with authentication tag
+            ciphertext: Encrypted data with authentication tag (any
+                bytes-like object, e.g. a memoryview of a receive buffer)
             nonce: Nonce (12 bytes)
 
         Returns:
@@ -345,19 +594,12 @@ class AirPlayCrypto:
             return None
 
         try:
-            # Derive decryption key if not already done
-            if not self.decryption_key:
-                hkdf = HKDF(
-                    algorithm=hashes.SHA512(),
-                    length=32,
-                    salt=b"Pair-Verify-Decrypt-Salt",
-                    info=b"Pair-Verify-Decrypt-Info",
-                    backend=default_backend()
-                )
-                self.decryption_key = hkdf.derive(self.shared_secret)
-
-            # Create cipher
-            cipher = ChaCha20Poly1305(self.decryption_key)
+            # Derive decryption key and cipher if not already done
+            if self._dec_cipher is None:
+                self.decryption_key = self._derive_key(
+                    self.shared_secret, _PAIR_VERIFY_DECRYPT_SALT, _PAIR_VERIFY_DECRYPT_INFO)
+                self._dec_cipher = ChaCha20Poly1305(self.decryption_key)
+            cipher = self._dec_cipher
 
             # Decrypt
             plaintext = cipher.decrypt(nonce, ciphertext, None)
@@ -377,66 +619,191 @@ class AirPlayCrypto:
 
         Returns:
             Signature (64 bytes)
+
+        Raises:
+            RuntimeError: If there is no identity key to sign with
         """
-        if not CRYPTO_AVAILABLE or not self.ed_private_key:
-            return os.urandom(64)
+        if not self.ed_private_key:
+            raise RuntimeError("Ed25519 identity key not set up")
 
         try:
-            signature = self.ed_private_key.sign(data)
-            return signature
+            if NACL_AVAILABLE:
+                # libsodium returns signature + message; keep the signature
+                return self.ed_private_key.sign(data).signature
+            return self.ed_private_key.sign(data)
         except Exception as e:
             logger.error(f"Signing error: {e}")
-            return os.urandom(64)
+            raise
+
+
+def open_hw_h264_decoder():
+    """
+    Open the first hardware H.264 decoder that works on this machine
+
+    Returns:
+        Opened codec context, or None to use the software decoder
+    """
+    if not VIDEO_AVAILABLE:
+        return None
+    for name in _HW_H264_DECODERS:
+        if name not in av.codecs_available:
+            continue
+        try:
+            codec = av.CodecContext.create(name, 'r')
+            # Open eagerly: these decoders are built into FFmpeg even when
+            # the GPU/driver is missing, which only shows up at open time
+            codec.open()
+            logger.info(f"H.264 decoder initialized ({name})")
+            return codec
+        except Exception as e:
+            logger.debug(f"Hardware decoder {name} unavailable: {e}")
+    return None
 
 
 class H264Decoder:
     """H.264 video decoder using PyAV"""
 
-    def __init__(self):
-        """Initialize H.264 decoder"""
+    def __init__(self, pixel_format: str = 'bgr24'):
+        """
+        Initialize H.264 decoder
+
+        Args:
+            pixel_format: Output format of decode_frame ('bgr24' for the
+                stream manager, or e.g. 'nv12'/'yuv420p' for consumers that
+                take YUV directly)
+        """
         self.codec = None
         self.decoder = None
+        self.pixel_format = pixel_format
+
+        # Access unit being assembled from NAL units
+        self._au_buf = bytearray()
+        self._au_has_slice = False
+
+        self.hw_accelerated = False
 
         if VIDEO_AVAILABLE:
-            try:
-                self.codec = av.CodecContext.create('h264', 'r')
-                self.codec.thread_type = 'AUTO'
-                logger.info("H.264 decoder initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize H.264 decoder: {e}")
+            self.codec = open_hw_h264_decoder()
+            if self.codec is not None:
+                self.hw_accelerated = True
+            else:
+                self.codec = self._open_sw_codec()
+
+    @staticmethod
+    def _open_sw_codec():
+        """Open the software H.264 decoder"""
+        try:
+            codec = av.CodecContext.create('h264', 'r')
+            codec.thread_type = 'AUTO'
+            logger.info("H.264 decoder initialized")
+            return codec
+        except Exception as e:
+            logger.error(f"Failed to initialize H.264 decoder: {e}")
+            return None
 
     def decode_frame(self, h264_data: bytes) -> Optional[np.ndarray]:
         """
-        Decode H.264 frame to numpy array
+        Decode H.264 data to numpy array
+
+        Annex B NAL units are collected until a complete access unit is
+        buffered and then decoded with a single codec call, so the frame for
+        an access unit is returned when the first NAL unit of the next one
+        arrives. Data without a start code is decoded as-is.
 
         Args:
-            h264_data: Raw H.264 encoded data
+            h264_data: Raw H.264 encoded data (one or more NAL units, as
+                bytes or a memoryview)
 
         Returns:
-            Decoded frame as numpy array (BGR format) or None
+            Decoded frame as numpy array (in self.pixel_format) or None
         """
         if not VIDEO_AVAILABLE or not self.codec:
             return None
 
+        nal_type, first_slice = self._parse_nal_header(h264_data)
+        if nal_type is None:
+            return self._decode_packet(h264_data)
+
+        img = None
+        if self._au_has_slice and (first_slice or nal_type in _H264_AU_START_TYPES):
+            img = self._decode_packet(bytes(self._au_buf))
+            self._au_buf.clear()
+            self._au_has_slice = False
+
+        self._au_buf += h264_data
+        if 1 <= nal_type <= 5:
+            self._au_has_slice = True
+        return img
+
+    @staticmethod
+    def _parse_nal_header(data: bytes) -> Tuple[Optional[int], bool]:
+        """
+        Read the NAL unit type after an Annex B start code
+
+        Returns:
+            (nal_unit_type or None without a start code, whether this is a
+            slice with first_mb_in_slice == 0)
+        """
+        # Slice comparisons so memoryviews of the stream buffer work too
+        if data[:4] == b'\x00\x00\x00\x01':
+            pos = 4
+        elif data[:3] == b'\x00\x00\x01':
+            pos = 3
+        else:
+            return None, False
+        if len(data) <= pos + 1:
+            return None, False
+
+        nal_type = data[pos] & 0x1f
+        # first_mb_in_slice is ue(v); a value of 0 is the single bit '1'
+        first_slice = 1 <= nal_type <= 5 and bool(data[pos + 1] & 0x80)
+        return nal_type, first_slice
+
+    def _decode_packet(self, h264_data: bytes) -> Optional[np.ndarray]:
+        """Decode one packet and return its first frame (or None)"""
         try:
             # Create packet from data
             packet = av.Packet(h264_data)
 
             # Decode packet
             frames = self.codec.decode(packet)
-
-            # Get first frame
-            for frame in frames:
-                # Convert to numpy array
-                img = frame.to_ndarray(format='bgr24')
-                return img
-
-            return None
-
         except Exception as e:
+            if self.hw_accelerated:
+                # Some hardware decoders only fail once they see real data;
+                # drop to software for the rest of the session
+                logger.warning(f"Hardware H.264 decode failed, using software decoder: {e}")
+                self.close()
+                self.hw_accelerated = False
+                self.codec = self._open_sw_codec()
+                # Retry the same data, it may carry the stream's parameter sets
+                return self._decode_packet(h264_data) if self.codec else None
             logger.error(f"Frame decode error: {e}")
             return None
 
+        # Get first frame; conversion errors are not decoder failures, so
+        # they stay out of the hardware fallback above
+        for frame in frames:
+            try:
+                return self._convert_frame(frame)
+            except Exception as e:
+                logger.error(f"Frame conversion error: {e}")
+                return None
+
+        return None
+
+    def _convert_frame(self, frame) -> np.ndarray:
+        """Convert a decoded av.VideoFrame to a numpy array in self.pixel_format"""
+        if self.pixel_format != 'bgr24':
+            return frame.to_ndarray(format=self.pixel_format)
+
+        # Take the planes as-is and let OpenCV's SIMD path do the colour
+        # conversion, which is faster than swscale's bgr24. Exporting 4:2:0
+        # planes needs even dimensions, so odd-sized frames go through swscale
+        code = _YUV_TO_BGR.get(frame.format.name)
+        if code is not None and frame.width % 2 == 0 and frame.height % 2 == 0:
+            return cv2.cvtColor(frame.to_ndarray(), code)
+        return frame.to_ndarray(format='bgr24')
+
     def close(self):
         """Close decoder"""
         if self.codec:
@@ -446,13 +813,105 @@ class H264Decoder:
                 pass
 
 
+class AirPlayStreamProtocol(asyncio.BufferedProtocol):
+    """
+    Receives the mirroring stream directly into a reusable bytearray
+
+    The connection is switched to this protocol once POST /stream has been
+    answered, so the socket writes stream bytes straight into the buffer the
+    NAL scanner reads instead of into a new bytes object per read.
+    Received data lives in buffer[start:end].
+    """
+
+    def __init__(self, transport: asyncio.BaseTransport, crypto: Optional[AirPlayCrypto] = None):
+        self.buffer = bytearray(_STREAM_BUFFER_SIZE)
+        self.start = 0
+        self.end = 0
+        self.closed = False
+        # The StreamReaderProtocol being replaced still has to learn about the
+        # connection closing, or StreamWriter.wait_closed() never returns
+        self._stream_protocol = transport.get_protocol()
+        # Pairing is settled before the stream starts, so decide once whether
+        # chunks are encrypted instead of checking the session per read
+        self._decrypt = (crypto.decrypt_data
+                         if crypto is not None and crypto.is_paired and crypto.decryption_key
+                         else None)
+        self._data_ready = asyncio.Event()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return the free tail of the buffer, making room if needed"""
+        needed = max(sizehint, _STREAM_READ_SIZE)
+        if len(self.buffer) - self.end < needed:
+            # Move the unconsumed bytes to the front, then grow if that is
+            # still not enough
+            pending = self.end - self.start
+            if self.start:
+                self.buffer[:pending] = self.buffer[self.start:self.end]
+                self.start = 0
+                self.end = pending
+            if len(self.buffer) - self.end < needed:
+                self.buffer += bytes(max(len(self.buffer), needed))
+        return memoryview(self.buffer)[self.end:]
+
+    def buffer_updated(self, nbytes: int):
+        """Account for nbytes written into the buffer by the transport"""
+        decrypt = self._decrypt
+        if decrypt is not None:
+            # Each received chunk is nonce + ciphertext, decrypted straight
+            # from the buffer; the plaintext is shorter, so it is written
+            # back in place
+            with memoryview(self.buffer) as view:
+                chunk = view[self.end:self.end + nbytes]
+                decrypted = decrypt(chunk[12:], chunk[:12])
+                del chunk
+            if not decrypted:
+                logger.debug("Failed to decrypt data")
+                return
+            self.buffer[self.end:self.end + len(decrypted)] = decrypted
+            nbytes = len(decrypted)
+
+        self.end += nbytes
+        self._data_ready.set()
+
+    def feed_data(self, data: bytes):
+        """Add bytes received before the connection was switched over"""
+        with self.get_buffer(len(data)) as view:
+            view[:len(data)] = data
+        self.buffer_updated(len(data))
+
+    def consume(self, pos: int):
+        """Mark everything before pos as processed"""
+        self.start = pos
+
+    async def wait_for_data(self):
+        """Wait until new data arrives or the connection closes"""
+        await self._data_ready.wait()
+        self._data_ready.clear()
+
+    def eof_received(self):
+        self.closed = True
+        self._data_ready.set()
+
+    def connection_lost(self, exc):
+        self.closed = True
+        self._data_ready.set()
+        self._stream_protocol.connection_lost(exc)
+
+
+@dataclass(slots=True)
+class ConnectionInfo:
+    """An active mirroring connection"""
+    name: str
+    start_time: int  # time.monotonic_ns() when the stream started
+
+
 class AirPlayReceiver:
     """
     Complete AirPlay receiver with real cryptography
     Supports iPhone/iPad screen mirroring without external dependencies
     """
 
-    def __init__(self, stream_manager, name="Desktop Casting Receiver", port=7000):
+    def __init__(self, stream_manager, name="Desktop Casting Receiver", port=7000, zeroconf=None):
         """
         Initialize AirPlay receiver
 
@@ -460,21 +919,39 @@ class AirPlayReceiver:
             stream_manager: The StreamManager instance to add streams to
             name: The name to advertise as
             port: Port to listen on for AirPlay connections
+            zeroconf: Optional shared Zeroconf instance (not closed on stop)
         """
         self.stream_manager = stream_manager
         self.name = name
         self.port = port
-        self.zeroconf: Optional[Zeroconf] = None
+        self.zeroconf: Optional[Zeroconf] = zeroconf
+        self._owns_zeroconf = zeroconf is None
         self.service_info: Optional[ServiceInfo] = None
         self.running = False
         self.server_task: Optional[asyncio.Task] = None
-        self.active_connections: Dict[str, dict] = {}
+        self.active_connections: Dict[str, ConnectionInfo] = {}
 
-        # Cryptography
+        # Server event loop and shutdown signal (created on the server thread)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+        # Cryptography (the identity key is needed by /info and pair-verify
+        # whether or not the service gets advertised)
         self.crypto = AirPlayCrypto()
+        self.crypto.setup_ed25519()
+
+        # Device ID from the hardware MAC so it is stable across restarts
+        # (hash() of a str is randomized per process)
+        self._device_id: str = uuid.getnode().to_bytes(6, 'big').hex(':')
+        self._device_id_bytes: bytes = self._device_id.encode()
 
-        # Video decoder
-        self.decoder = H264Decoder()
+        # Serialized /info and /server-info responses (built on first request)
+        self._info_response: Optional[bytes] = None
+        self._server_info_response: Optional[bytes] = None
+
+        # Rendered placeholder frames keyed by (device name, status), LRU order
+        self._placeholder_cache: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
 
         # Check dependencies
         self._check_dependencies()
@@ -501,12 +978,34 @@ class AirPlayReceiver:
         else:
             logger.info("✓ All AirPlay dependencies available")
 
+    @property
+    def name(self) -> str:
+        """Name the receiver is advertised as"""
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        # /info and /server-info embed the name, so drop their cached payloads
+        self._name = value
+        self._info_response = None
+        self._server_info_response = None
+
     def start(self):
         """Start the AirPlay receiver service"""
         if self.running:
             logger.warning("AirPlay receiver already running")
             return
 
+        # Called from inside an event loop: host the server on that loop
+        # instead of spinning up a second loop on its own thread
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            self.server_task = loop.create_task(self.start_async())
+            return
+
         self.running = True
 
         # Start mDNS service advertisement
@@ -518,19 +1017,56 @@ class AirPlayReceiver:
 
         logger.info(f"✓ AirPlay receiver started on port {self.port}")
 
+    async def start_async(self):
+        """
+        Start the AirPlay receiver on the currently running event loop
+
+        Use this instead of start() when the caller already runs an asyncio
+        loop and wants the AirPlay server on it rather than on its own thread.
+        """
+        if self.running:
+            logger.warning("AirPlay receiver already running")
+            return
+
+        self.running = True
+
+        # Start mDNS service advertisement (zeroconf's sync API must not
+        # run on the event loop thread)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._advertise_service)
+
+        await self._start_listening()
+
+        logger.info(f"✓ AirPlay receiver started on port {self.port}")
+
+    async def stop_async(self):
+        """Stop a receiver running on this event loop and wait for its server to close"""
+        server = self._server
+        await asyncio.get_running_loop().run_in_executor(None, self.stop)
+        if server:
+            await server.wait_closed()
+
     def stop(self):
         """Stop the AirPlay receiver service"""
         self.running = False
 
+        # Wake up connections waiting for shutdown and stop accepting new ones
+        # (both live on the server loop, which may be another thread)
+        if self._loop and self._stop_event:
+            try:
+                self._loop.call_soon_threadsafe(self._stop_event.set)
+                if self._server:
+                    self._loop.call_soon_threadsafe(self._server.close)
+            except RuntimeError:
+                pass
+
         # Stop mDNS advertisement
         if self.zeroconf and self.service_info:
             self.zeroconf.unregister_service(self.service_info)
-            self.zeroconf.close()
-            self.zeroconf = None
             self.service_info = None
-
-        # Close decoder
-        self.decoder.close()
+            if self._owns_zeroconf:
+                self.zeroconf = None
+                release_zeroconf()
 
         logger.info("AirPlay receiver stopped")
 
@@ -544,22 +1080,22 @@ class AirPlayReceiver:
         try:
             # Get local IP address
             hostname = socket.gethostname()
-            local_ip = socket.gethostbyname(hostname)
+            local_ip = get_local_ip()
 
             # Create service info for AirPlay
             service_type = "_airplay._tcp.local."
             service_name = f"{self.name}.{service_type}"
 
-            # Generate Ed25519 key for pairing
-            public_key_bytes = self.crypto.setup_curve25519()
+            # Ed25519 identity key for pairing
+            public_key_bytes = self.crypto.setup_ed25519()
 
             # AirPlay service properties
             properties = {
-                b'deviceid': self._get_device_id().encode(),
+                b'deviceid': self._get_device_id_bytes(),
                 b'features': b'0x5A7FFFF7,0x1E',  # Screen mirroring support
                 b'flags': b'0x4',
                 b'model': b'AppleTV3,2',
-                b'pi': self._get_device_id().encode(),
+                b'pi': self._get_device_id_bytes(),
                 b'psi': b'00000000-0000-0000-0000-000000000000',
                 b'pk': public_key_bytes,  # Real Ed25519 public key
                 b'srcvers': b'366.0',
@@ -576,27 +1112,39 @@ class AirPlayReceiver:
                 server=f"{hostname}.local."
             )
 
-            self.zeroconf = Zeroconf()
+            # Use the process-wide Zeroconf instance unless one was passed in
+            if self.zeroconf is None:
+                self.zeroconf = get_zeroconf()
             self.zeroconf.register_service(self.service_info)
 
             logger.info(f"✓ AirPlay service advertised as '{self.name}' at {local_ip}:{self.port}")
 
         except Exception as e:
             logger.error(f"Failed to advertise AirPlay service: {e}")
+            self.service_info = None
+            if self._owns_zeroconf and self.zeroconf:
+                self.zeroconf = None
+                release_zeroconf()
 
     def _get_device_id(self) -> str:
-        """Generate a unique device ID"""
-        mac = ':'.join(['{:02x}'.format((hash(socket.gethostname()) >> i) & 0xff)
-                       for i in range(0, 48, 8)])
-        return mac
+        """Get the unique device ID (computed once in __init__)"""
+        return self._device_id
+
+    def _get_device_id_bytes(self) -> bytes:
+        """Get the device ID as UTF-8 bytes"""
+        return self._device_id_bytes
 
     def _run_server(self):
         """Run the AirPlay server in a background thread"""
-        loop = asyncio.new_event_loop()
+        # Only this thread's loop uses uvloop; the global policy is left alone
+        loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
         try:
             loop.run_until_complete(self._server_loop())
+        except asyncio.CancelledError:
+            # serve_forever() is cancelled when stop() closes the server
+            pass
         except Exception as e:
             logger.error(f"AirPlay server error: {e}")
         finally:
@@ -604,65 +1152,89 @@ class AirPlayReceiver:
 
     async def _server_loop(self):
         """Main server loop for handling AirPlay connections"""
-        server = await asyncio.start_server(
+        server = await self._start_listening()
+
+        async with server:
+            await server.serve_forever()
+
+    async def _start_listening(self) -> asyncio.AbstractServer:
+        """Bind the AirPlay server on the running loop"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+
+        self._server = await asyncio.start_server(
             self._handle_client,
             '0.0.0.0',
             self.port
         )
 
         logger.info(f"✓ AirPlay server listening on port {self.port}")
-
-        async with server:
-            await server.serve_forever()
+        return self._server
 
     async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """Handle an incoming AirPlay client connection"""
         addr = writer.get_extra_info('peername')
         client_id = f"airplay_{addr[0]}_{int(time.time())}"
 
-        logger.info(f"AirPlay connection from {addr}")
+        logger.info("AirPlay connection from %s", addr)
+
+        # Small request/response exchanges must not wait on Nagle + delayed ACK
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
 
         try:
-            # Keep connection alive for multiple requests
-            while True:
-                # Read HTTP-style request with timeout
+            # Keep connection alive for multiple requests (until the receiver stops)
+            while self.running:
+                # Read the request line and header block in one go
                 try:
-                    request_line = await asyncio.wait_for(reader.readline(), timeout=30.0)
+                    header_block = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), timeout=30.0)
                 except asyncio.TimeoutError:
-                    logger.info(f"Connection timeout for {addr}")
+                    logger.info("Connection timeout for %s", addr)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
                     break
 
-                request = request_line.decode('utf-8', errors='ignore').strip()
+                lines = header_block[:-4].split(b'\r\n')
+                request_line = lines[0].strip()
 
-                if not request:
+                if not request_line:
                     break
 
-                # Read headers
+                # Parse headers (kept as lowercase bytes keys)
                 headers = {}
                 content_length = 0
-                while True:
-                    line = await reader.readline()
-                    if line == b'\r\n' or line == b'\n' or not line:
-                        break
-                    try:
-                        header_line = line.decode('utf-8', errors='ignore').strip()
-                        if ':' in header_line:
-                            key, value = header_line.split(':', 1)
-                            key_lower = key.strip().lower()
-                            headers[key_lower] = value.strip()
-                            if key_lower == 'content-length':
-                                content_length = int(value.strip())
-                    except:
-                        pass
-
-                # Read body if present
+                for line in lines[1:]:
+                    key, sep, value = line.partition(b':')
+                    if not sep:
+                        continue
+                    headers[key.strip().lower()] = value.strip()
+                try:
+                    content_length = int(headers.get(b'content-length', 0))
+                except ValueError:
+                    pass
+
+                if content_length > _MAX_BODY_SIZE:
+                    logger.warning("Rejecting %d byte request body from %s", content_length, addr)
+                    break
+
+                # Read body if present (read() may return a short body)
                 body = b''
                 if content_length > 0:
-                    body = await reader.read(content_length)
+                    try:
+                        body = await asyncio.wait_for(reader.readexactly(content_length), timeout=30.0)
+                    except asyncio.TimeoutError:
+                        logger.info("Connection timeout for %s", addr)
+                        break
+                    except asyncio.IncompleteReadError:
+                        break
 
                 # Handle different AirPlay requests
-                if 'POST' in request or 'GET' in request:
-                    await self._handle_airplay_request(request, headers, reader, writer, client_id, body)
+                if request_line.startswith((b'POST ', b'GET ')):
+                    await self._handle_airplay_request(request_line, headers, reader, writer, client_id, body)
                 else:
                     break
 
@@ -675,91 +1247,78 @@ class AirPlayReceiver:
             except:
                 pass
 
-    async def _handle_airplay_request(self, request: str, headers: dict,
+    async def _handle_airplay_request(self, request_line: bytes, headers: dict,
                                       reader: asyncio.StreamReader,
                                       writer: asyncio.StreamWriter,
                                       client_id: str,
                                       body: bytes = b''):
         """Handle specific AirPlay protocol requests"""
 
-        # Parse request
-        parts = request.split()
+        # Parse request line (METHOD PATH VERSION) without decoding it
+        parts = request_line.split(b' ', 2)
         if len(parts) < 2:
             return
 
         method = parts[0]
-        path = parts[1]
-
-        logger.info(f"AirPlay request: {method} {path} (body: {len(body)} bytes)")
-
-        # Handle different endpoints
-        if '/info' in path:
-            await self._handle_info(writer)
-
-        elif '/server-info' in path:
-            await self._handle_server_info(writer)
-
-        elif path == '/pair-setup' and method == 'POST':
-            # Real SRP-6a authentication
-            await self._handle_pair_setup(writer, body)
-
-        elif path == '/pair-verify' and method == 'POST':
-            # Real Ed25519 key exchange
-            await self._handle_pair_verify(writer, body)
-
-        elif path == '/fp-setup' and method == 'POST':
-            # FairPlay setup
-            await self._handle_fp_setup(writer, body)
-
-        elif '/stream' in path and method == 'POST':
-            # Video stream
-            await self._handle_stream(reader, writer, client_id, headers)
+        path = parts[1].partition(b'?')[0]
+
+        # The request line is only decoded when it is actually logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("AirPlay request: %s %s (body: %d bytes)",
+                         method.decode('ascii', 'replace'), path.decode('ascii', 'replace'), len(body))
+
+        # Exact (method, path) routes first, then the prefix-matched endpoints
+        handler = self._ROUTES.get((method, path))
+        if handler is None:
+            if method == b'POST' and path.startswith(b'/stream'):
+                # Video stream
+                handler = AirPlayReceiver._handle_stream
+            elif path.startswith(b'/reverse'):
+                # Reverse HTTP connection
+                handler = AirPlayReceiver._handle_reverse_http
+            else:
+                # Unknown endpoint
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Unknown endpoint: %s %s",
+                                 method.decode('ascii', 'replace'), path.decode('ascii', 'replace'))
+                handler = AirPlayReceiver._handle_empty
 
-        elif '/reverse' in path:
-            # Reverse HTTP connection
-            await self._handle_reverse_http(reader, writer, client_id)
+        await handler(self, reader, writer, client_id, headers, body)
 
-        elif path == '/feedback' and method == 'POST':
-            # Feedback
-            response = (
-                "HTTP/1.1 200 OK\r\n"
-                "Server: AirPlay/366.0\r\n"
-                "Content-Length: 0\r\n"
-                "\r\n"
-            )
-            writer.write(response.encode())
-            await writer.drain()
-
-        else:
-            # Unknown endpoint
-            logger.info(f"Unknown endpoint: {method} {path}")
-            response = (
-                "HTTP/1.1 200 OK\r\n"
-                "Server: AirPlay/366.0\r\n"
-                "Content-Length: 0\r\n"
-                "\r\n"
-            )
-            writer.write(response.encode())
-            await writer.drain()
+    async def _handle_empty(self, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter,
+                            client_id: str,
+                            headers: dict,
+                            body: bytes):
+        """Handle /feedback and unknown endpoints with an empty 200 response"""
+        writer.write(_EMPTY_RESPONSE)
+        await writer.drain()
 
-    async def _handle_pair_setup(self, writer: asyncio.StreamWriter, body: bytes):
+    async def _handle_pair_setup(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter,
+                                 client_id: str,
+                                 headers: dict,
+                                 body: bytes):
         """Handle /pair-setup with real SRP-6a authentication"""
-        logger.info("Handling pair-setup (real SRP-6a)")
+        logger.debug("Handling pair-setup (real SRP-6a)")
 
         # Decode TLV8 request
         request_tlv = tlv8_decode(body) if body else {}
-        state = request_tlv.get(0x06, b'\x01')[0]
+        state = tlv8_read_u8(request_tlv, 0x06)
+
+        logger.debug("Pair-setup state: %d", state)
 
-        logger.info(f"Pair-setup state: {state}")
+        # Response TLVs are appended into a single buffer
+        tlv_data = bytearray()
 
         if state == 1:
             # M1->M2: Send salt + server public key
             salt, server_public = self.crypto.setup_srp()
 
             response_state = 2
-            tlv_data = tlv8_encode(0x06, bytes([response_state]))  # State
-            tlv_data += tlv8_encode(0x02, salt)  # Salt
-            tlv_data += tlv8_encode(0x03, server_public)  # Public Key
+            tlv8_write_u8(tlv_data, 0x06, response_state)  # State
+            tlv8_write(tlv_data, 0x02, salt)  # Salt
+            tlv8_write(tlv_data, 0x03, server_public)  # Public Key
 
         elif state == 3:
             # M3->M4: Verify client proof
@@ -769,43 +1328,42 @@ class AirPlayReceiver:
             server_proof = self.crypto.verify_srp(client_public, client_proof)
 
             response_state = 4
-            tlv_data = tlv8_encode(0x06, bytes([response_state]))  # State
+            tlv8_write_u8(tlv_data, 0x06, response_state)  # State
 
             if server_proof:
-                tlv_data += tlv8_encode(0x04, server_proof)  # Proof
+                tlv8_write(tlv_data, 0x04, server_proof)  # Proof
                 logger.info("✓ SRP verification successful")
             else:
-                tlv_data += tlv8_encode(0x07, bytes([2]))  # Error = authentication failed
+                tlv8_write_u8(tlv_data, 0x07, 2)  # Error = authentication failed
                 logger.warning("SRP verification failed")
 
         else:
             # Unknown state
             response_state = state + 1
-            tlv_data = tlv8_encode(0x06, bytes([response_state]))
-            tlv_data += tlv8_encode(0x07, bytes([1]))  # Error = unknown
-
-        # Send response
-        response = (
-            "HTTP/1.1 200 OK\r\n"
-            "Content-Type: application/octet-stream\r\n"
-            f"Content-Length: {len(tlv_data)}\r\n"
-            "Server: AirTunes/366.0\r\n"
-            "\r\n"
-        )
-        writer.write(response.encode())
-        writer.write(tlv_data)
+            tlv8_write_u8(tlv_data, 0x06, response_state)
+            tlv8_write_u8(tlv_data, 0x07, 1)  # Error = unknown
+
+        # Send header and body together (no concatenation)
+        writer.writelines((_OCTET_STREAM_HEADER % len(tlv_data), tlv_data))
         await writer.drain()
-        logger.info(f"Sent pair-setup response (state {response_state})")
+        logger.debug("Sent pair-setup response (state %d)", response_state)
 
-    async def _handle_pair_verify(self, writer: asyncio.StreamWriter, body: bytes):
-        """Handle /pair-verify with real Ed25519 key exchange"""
-        logger.info("Handling pair-verify (real Ed25519)")
+    async def _handle_pair_verify(self, reader: asyncio.StreamReader,
+                                  writer: asyncio.StreamWriter,
+                                  client_id: str,
+                                  headers: dict,
+                                  body: bytes):
+        """Handle /pair-verify with real X25519 key exchange"""
+        logger.debug("Handling pair-verify (real X25519)")
 
         # Decode TLV8 request
         request_tlv = tlv8_decode(body) if body else {}
-        state = request_tlv.get(0x06, b'\x01')[0]
+        state = tlv8_read_u8(request_tlv, 0x06)
 
-        logger.info(f"Pair-verify state: {state}")
+        logger.debug("Pair-verify state: %d", state)
+
+        # Response TLVs are appended into a single buffer
+        tlv_data = bytearray()
 
         if state == 1:
             # M1->M2: Exchange public keys
@@ -813,21 +1371,21 @@ class AirPlayReceiver:
             server_public = self.crypto.setup_curve25519()
 
             # Compute shared secret
-            self.crypto.compute_shared_secret(client_public, server_public)
+            self.crypto.compute_shared_secret(client_public)
 
             # Sign the concatenated public keys
             sign_data = server_public + client_public
             signature = self.crypto.sign_data(sign_data)
 
             # Encrypt signature + device info
-            device_info = b'\x00' + self._get_device_id().encode()
+            device_info = b'\x00' + self._get_device_id_bytes()
             plaintext = device_info + signature
             encrypted_data = self.crypto.encrypt_data(plaintext)
 
             response_state = 2
-            tlv_data = tlv8_encode(0x06, bytes([response_state]))  # State
-            tlv_data += tlv8_encode(0x03, server_public)  # Public Key
-            tlv_data += tlv8_encode(0x05, encrypted_data)  # Encrypted Data
+            tlv8_write_u8(tlv_data, 0x06, response_state)  # State
+            tlv8_write(tlv_data, 0x03, server_public)  # Public Key
+            tlv8_write(tlv_data, 0x05, encrypted_data)  # Encrypted Data
 
         elif state == 3:
             # M3->M4: Verify client
@@ -838,148 +1396,123 @@ class AirPlayReceiver:
             self.crypto.is_paired = True
 
             response_state = 4
-            tlv_data = tlv8_encode(0x06, bytes([response_state]))  # State
+            tlv8_write_u8(tlv_data, 0x06, response_state)  # State
             logger.info("✓ Pair-verify successful")
 
         else:
             # Unknown state
             response_state = state + 1
-            tlv_data = tlv8_encode(0x06, bytes([response_state]))
-            tlv_data += tlv8_encode(0x07, bytes([1]))  # Error
-
-        # Send response
-        response = (
-            "HTTP/1.1 200 OK\r\n"
-            "Content-Type: application/octet-stream\r\n"
-            f"Content-Length: {len(tlv_data)}\r\n"
-            "Server: AirTunes/366.0\r\n"
-            "\r\n"
-        )
-        writer.write(response.encode())
-        writer.write(tlv_data)
+            tlv8_write_u8(tlv_data, 0x06, response_state)
+            tlv8_write_u8(tlv_data, 0x07, 1)  # Error
+
+        # Send header and body together (no concatenation)
+        writer.writelines((_OCTET_STREAM_HEADER % len(tlv_data), tlv_data))
         await writer.drain()
-        logger.info(f"Sent pair-verify response (state {response_state})")
+        logger.debug("Sent pair-verify response (state %d)", response_state)
 
-    async def _handle_fp_setup(self, writer: asyncio.StreamWriter, body: bytes):
+    async def _handle_fp_setup(self, reader: asyncio.StreamReader,
+                               writer: asyncio.StreamWriter,
+                               client_id: str,
+                               headers: dict,
+                               body: bytes):
         """Handle FairPlay setup"""
-        logger.info("Handling fp-setup")
+        logger.debug("Handling fp-setup")
 
         # FairPlay can be skipped for screen mirroring
         response_data = b''
 
-        response = (
-            "HTTP/1.1 200 OK\r\n"
-            "Content-Type: application/octet-stream\r\n"
-            f"Content-Length: {len(response_data)}\r\n"
-            "Server: AirTunes/366.0\r\n"
-            "\r\n"
-        )
-        writer.write(response.encode())
-        if response_data:
-            writer.write(response_data)
+        writer.writelines((_OCTET_STREAM_HEADER % len(response_data), response_data))
         await writer.drain()
 
-    async def _handle_info(self, writer: asyncio.StreamWriter):
+    async def _handle_info(self, reader: asyncio.StreamReader,
+                           writer: asyncio.StreamWriter,
+                           client_id: str,
+                           headers: dict,
+                           body: bytes):
         """Handle /info request"""
-        info = {
-            'deviceid': self._get_device_id(),
-            'features': 0x5A7FFFF7,
-            'model': 'AppleTV3,2',
-            'protovers': '1.1',
-            'srcvers': '366.0',
-            'name': self.name,
-            'pi': self._get_device_id(),
-            'pk': self.crypto.ed_public_key.public_bytes(
-                encoding=serialization.Encoding.Raw,
-                format=serialization.PublicFormat.Raw
-            ) if CRYPTO_AVAILABLE and self.crypto.ed_public_key else b'',
-            'vv': 2,
-            'statusFlags': 0x4,
-            'keepAliveLowPower': 1,
-            'keepAliveSendStatsAsBody': 1,
-        }
+        if self._info_response is None:
+            info = {
+                'deviceid': self._get_device_id(),
+                'features': 0x5A7FFFF7,
+                'model': 'AppleTV3,2',
+                'protovers': '1.1',
+                'srcvers': '366.0',
+                'name': self.name,
+                'pi': self._get_device_id(),
+                'pk': self.crypto.ed_public_bytes or b'',
+                'vv': 2,
+                'statusFlags': 0x4,
+                'keepAliveLowPower': 1,
+                'keepAliveSendStatsAsBody': 1,
+            }
 
-        try:
-            plist_data = plistlib.dumps(info, fmt=plistlib.FMT_BINARY)
-        except:
-            plist_data = plistlib.dumps(info, fmt=plistlib.FMT_XML)
-
-        response = (
-            "HTTP/1.1 200 OK\r\n"
-            "Content-Type: application/x-apple-binary-plist\r\n"
-            f"Content-Length: {len(plist_data)}\r\n"
-            "Server: AirTunes/366.0\r\n"
-            "\r\n"
-        )
-        writer.write(response.encode())
-        writer.write(plist_data)
+            try:
+                plist_data = plistlib.dumps(info, fmt=plistlib.FMT_BINARY)
+            except:
+                plist_data = plistlib.dumps(info, fmt=plistlib.FMT_XML)
+
+            self._info_response = _PLIST_HEADER % len(plist_data) + plist_data
+
+        writer.write(self._info_response)
         await writer.drain()
 
-    async def _handle_server_info(self, writer: asyncio.StreamWriter):
+    async def _handle_server_info(self, reader: asyncio.StreamReader,
+                                  writer: asyncio.StreamWriter,
+                                  client_id: str,
+                                  headers: dict,
+                                  body: bytes):
         """Handle /server-info request"""
-        server_info = {
-            'deviceid': self._get_device_id(),
-            'features': 0x5A7FFFF7,
-            'model': 'AppleTV3,2',
-            'protovers': '1.1',
-            'srcvers': '366.0',
-            'name': self.name,
-            'pi': self._get_device_id(),
-            'pk': b'',
-            'statusFlags': 0x4,
-        }
+        if self._server_info_response is None:
+            server_info = {
+                'deviceid': self._get_device_id(),
+                'features': 0x5A7FFFF7,
+                'model': 'AppleTV3,2',
+                'protovers': '1.1',
+                'srcvers': '366.0',
+                'name': self.name,
+                'pi': self._get_device_id(),
+                'pk': b'',
+                'statusFlags': 0x4,
+            }
 
-        try:
-            plist_data = plistlib.dumps(server_info, fmt=plistlib.FMT_BINARY)
-        except:
-            plist_data = plistlib.dumps(server_info, fmt=plistlib.FMT_XML)
-
-        response = (
-            "HTTP/1.1 200 OK\r\n"
-            "Content-Type: application/x-apple-binary-plist\r\n"
-            f"Content-Length: {len(plist_data)}\r\n"
-            "Server: AirTunes/366.0\r\n"
-            "\r\n"
-        )
-        writer.write(response.encode())
-        writer.write(plist_data)
+            try:
+                plist_data = plistlib.dumps(server_info, fmt=plistlib.FMT_BINARY)
+            except:
+                plist_data = plistlib.dumps(server_info, fmt=plistlib.FMT_XML)
+
+            self._server_info_response = _PLIST_HEADER % len(plist_data) + plist_data
+
+        writer.write(self._server_info_response)
         await writer.drain()
 
     async def _handle_stream(self, reader: asyncio.StreamReader,
-                            writer: asyncio.StreamWriter,
-                            client_id: str,
-                            headers: dict):
+                             writer: asyncio.StreamWriter,
+                             client_id: str,
+                             headers: dict,
+                             body: bytes):
         """Handle incoming video stream"""
 
-        device_name = headers.get('x-apple-device-id', 'iPhone')
+        device_name = headers.get(b'x-apple-device-id', b'iPhone').decode('ascii', 'replace')
 
         # Send success response
-        response = (
-            "HTTP/1.1 200 OK\r\n"
-            "Server: AirPlay/366.0\r\n"
-            "\r\n"
-        )
-        writer.write(response.encode())
+        writer.write(_STREAM_RESPONSE)
         await writer.drain()
 
         logger.info(f"✓ Receiving AirPlay stream from {device_name}")
 
         # Add to active connections
-        self.active_connections[client_id] = {
-            'name': device_name,
-            'start_time': time.time()
-        }
+        self.active_connections[client_id] = ConnectionInfo(device_name, time.monotonic_ns())
 
         # Process stream
         try:
-            await self._process_video_stream(reader, client_id, device_name)
+            await self._process_video_stream(reader, writer, client_id, device_name)
         except Exception as e:
             logger.error(f"Error processing stream: {e}")
         finally:
-            if client_id in self.active_connections:
-                del self.active_connections[client_id]
+            self.active_connections.pop(client_id, None)
 
     async def _process_video_stream(self, reader: asyncio.StreamReader,
+                                    writer: asyncio.StreamWriter,
                                     client_id: str, device_name: str):
         """Process video stream with H.264 decoding"""
 
@@ -989,91 +1522,189 @@ class AirPlayReceiver:
         placeholder = self._create_placeholder_frame(device_name, "Connecting...")
         self.stream_manager.add_stream(client_id, placeholder, f"AirPlay: {device_name}")
 
+        # Take the connection over from the StreamReader. Nothing here
+        # suspends, so whatever the reader has already buffered comes before
+        # anything the protocol receives; feed_eof() also ends the request
+        # loop in _handle_client once the stream is over.
+        protocol = AirPlayStreamProtocol(writer.transport, self.crypto)
+        writer.transport.set_protocol(protocol)
+        reader.feed_eof()
+        pending = await reader.read()
+        if pending:
+            protocol.feed_data(pending)
+
+        # Decoding runs on a per-stream thread so a slow frame never holds
+        # up the event loop (other connections, discovery, reverse HTTP)
+        nal_queue = queue.SimpleQueue()
+        worker = threading.Thread(
+            target=self._decode_worker,
+            args=(nal_queue, client_id, device_name),
+            name=f"airplay-decode-{client_id}",
+            daemon=True
+        )
+        worker.start()
+
         try:
-            buffer = b''
-            frame_count = 0
+            buffer = protocol.buffer
+            scanned = 0
+            dropping = False
 
             while self.running:
                 try:
-                    # Read data
-                    data = await asyncio.wait_for(reader.read(8192), timeout=1.0)
-                    if not data:
-                        break
-
-                    # Check if data is encrypted
-                    if self.crypto.is_paired and self.crypto.decryption_key:
-                        # Decrypt data
-                        nonce = data[:12]
-                        ciphertext = data[12:]
-                        decrypted = self.crypto.decrypt_data(ciphertext, nonce)
-                        if decrypted:
-                            buffer += decrypted
-                        else:
-                            logger.warning("Failed to decrypt data")
-                            continue
-                    else:
-                        buffer += data
-
-                    # Try to decode H.264 frame
-                    if len(buffer) > 1024:  # Minimum frame size
-                        # Look for H.264 NAL units (start with 0x00000001)
-                        nal_start = buffer.find(b'\x00\x00\x00\x01')
-
-                        if nal_start != -1:
-                            # Find next NAL unit
-                            next_nal = buffer.find(b'\x00\x00\x00\x01', nal_start + 4)
-
-                            if next_nal != -1:
-                                # Extract complete NAL unit
-                                nal_data = buffer[nal_start:next_nal]
-                                buffer = buffer[next_nal:]
-
-                                # Decode frame
-                                decoded_frame = self.decoder.decode_frame(nal_data)
-
-                                if decoded_frame is not None:
-                                    self.stream_manager.update_stream(client_id, decoded_frame)
-                                    frame_count += 1
-                                    if frame_count % 30 == 0:
-                                        logger.info(f"Decoded {frame_count} frames from {device_name}")
+                    # Every wake-up drains all complete NAL units, so only
+                    # data arriving after this point is left to wait for
+                    await asyncio.wait_for(protocol.wait_for_data(), timeout=1.0)
+
+                    read_pos = protocol.start
+                    end = protocol.end
+                    scan_pos = read_pos + scanned
+
+                    # Hand every complete H.264 NAL unit (delimited by
+                    # 0x00000001 start codes) in the buffer to the decoder
+                    while True:
+                        nal_start = buffer.find(_NAL_START_CODE, read_pos, end)
+                        if nal_start == -1:
+                            break
+
+                        # Bytes before scan_pos were already searched on an
+                        # earlier pass, so a large NAL is not rescanned
+                        next_nal = buffer.find(_NAL_START_CODE, max(nal_start + 4, scan_pos), end)
+                        if next_nal == -1:
+                            # Back off so a start code split across reads is found
+                            scan_pos = max(end - 3, read_pos)
+                            break
+
+                        with memoryview(buffer) as view:
+                            nal_data = view[nal_start:next_nal].tobytes()
+                        read_pos = next_nal
+
+                        # If the decoder falls behind, skip non-IDR slices
+                        # until the next IDR; parameter sets are always kept
+                        nal_type = nal_data[4] & 0x1f if len(nal_data) > 4 else 0
+                        if not dropping and nal_queue.qsize() > _DECODE_QUEUE_HIGH_WATER:
+                            dropping = True
+                            logger.debug("Decoder behind on %s, skipping to next IDR", device_name)
+                        if dropping:
+                            if nal_type == 5:
+                                dropping = False
+                            elif 1 <= nal_type <= 4:
+                                continue
+
+                        nal_queue.put(nal_data)
 
                     # Prevent buffer from growing too large
-                    if len(buffer) > 1024 * 1024:  # 1MB
-                        buffer = buffer[-1024*1024:]
+                    if end - read_pos > 1024 * 1024:  # 1MB
+                        read_pos = end - 1024 * 1024
+                        scan_pos = read_pos
+
+                    scanned = max(scan_pos - read_pos, 0)
+                    protocol.consume(read_pos)
+
+                    if protocol.closed:
+                        break
 
                 except asyncio.TimeoutError:
                     continue
                 except Exception as e:
-                    logger.error(f"Stream read error: {e}")
+                    logger.error("Stream read error: %s", e)
                     break
 
         finally:
+            # Let the worker finish what is queued so no frame lands after
+            # the stream has been removed
+            nal_queue.put(None)
+            await asyncio.get_running_loop().run_in_executor(None, worker.join)
             self.stream_manager.remove_stream(client_id)
             logger.info(f"AirPlay stream ended for {device_name}")
 
+    def _decode_worker(self, nal_queue: queue.SimpleQueue, client_id: str, device_name: str):
+        """Decode one stream's queued NAL units until a None sentinel arrives"""
+        # Each stream gets its own decoder; H.264 decoder state is per stream
+        decoder = H264Decoder()
+        frame_count = 0
+
+        try:
+            while True:
+                nal_data = nal_queue.get()
+                if nal_data is None:
+                    break
+
+                decoded_frame = decoder.decode_frame(nal_data)
+                if decoded_frame is not None:
+                    self.stream_manager.update_stream(client_id, decoded_frame)
+                    frame_count += 1
+                    if frame_count % 30 == 0:
+                        logger.debug("Decoded %d frames from %s", frame_count, device_name)
+        except Exception as e:
+            logger.error(f"Decode worker error: {e}")
+        finally:
+            decoder.close()
+
     async def _handle_reverse_http(self, reader: asyncio.StreamReader,
                                    writer: asyncio.StreamWriter,
-                                   client_id: str):
+                                   client_id: str,
+                                   headers: dict,
+                                   body: bytes):
         """Handle reverse HTTP connection for events"""
-        response = (
-            "HTTP/1.1 101 Switching Protocols\r\n"
-            "Upgrade: PTTH/1.0\r\n"
-            "Connection: Upgrade\r\n"
-            "\r\n"
-        )
-        writer.write(response.encode())
+        writer.write(_REVERSE_RESPONSE)
         await writer.drain()
 
-        # Keep connection alive
-        while self.running:
-            await asyncio.sleep(1)
+        # The connection then sits idle; let the kernel probe it so a sender
+        # that vanished without closing shows up as a read error
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            self._enable_keepalive(sock)
+
+        async def wait_for_eof():
+            try:
+                while await reader.read(_STREAM_READ_SIZE):
+                    pass
+            except OSError:
+                pass
+
+        # Keep connection alive until the receiver is stopped or the client
+        # hangs up, so dropped connections do not linger until shutdown
+        waiters = {
+            asyncio.ensure_future(self._stop_event.wait()),
+            asyncio.ensure_future(wait_for_eof()),
+        }
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    @staticmethod
+    def _enable_keepalive(sock):
+        """Turn on TCP keepalive, with shorter timings where the platform allows"""
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # TCP_KEEPIDLE is TCP_KEEPALIVE on macOS
+            idle = getattr(socket, 'TCP_KEEPIDLE', getattr(socket, 'TCP_KEEPALIVE', None))
+            for option, value in ((idle, _REVERSE_KEEPALIVE_IDLE),
+                                  (getattr(socket, 'TCP_KEEPINTVL', None), _REVERSE_KEEPALIVE_INTERVAL),
+                                  (getattr(socket, 'TCP_KEEPCNT', None), _REVERSE_KEEPALIVE_COUNT)):
+                if option is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, option, value)
+        except OSError as e:
+            logger.debug(f"Could not enable TCP keepalive: {e}")
 
     def _create_placeholder_frame(self, device_name: str, status: str = "Connected") -> np.ndarray:
-        """Create a placeholder frame"""
-        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
-        frame[:] = (40, 40, 60)
+        """
+        Create a placeholder frame
+
+        Frames are cached per (device_name, status) and shared, so they are
+        marked read-only; the stream manager only ever replaces them.
+        """
+        key = (device_name, status)
+        frame = self._placeholder_cache.get(key)
+        if frame is not None:
+            self._placeholder_cache.move_to_end(key)
+            return frame
 
         font = cv2.FONT_HERSHEY_SIMPLEX
+        frame = _PLACEHOLDER_BASE.copy()
+
         cv2.putText(frame, f"AirPlay: {device_name}", (50, 300), font, 1.5, (255, 255, 255), 2)
         cv2.putText(frame, status, (50, 400), font, 1.0, (100, 255, 100), 2)
 
@@ -1082,8 +1713,25 @@ class AirPlayReceiver:
         else:
             cv2.putText(frame, "! Limited support - install dependencies", (50, 500), font, 0.6, (255, 100, 100), 1)
 
+        frame.flags.writeable = False
+        self._placeholder_cache[key] = frame
+        if len(self._placeholder_cache) > _PLACEHOLDER_CACHE_SIZE:
+            self._placeholder_cache.popitem(last=False)
+
         return frame
 
+    # Exact-match request routes: (method, path) -> handler
+    _ROUTES = {
+        (b'GET', b'/info'): _handle_info,
+        (b'POST', b'/info'): _handle_info,
+        (b'GET', b'/server-info'): _handle_server_info,
+        (b'POST', b'/server-info'): _handle_server_info,
+        (b'POST', b'/pair-setup'): _handle_pair_setup,      # Real SRP-6a authentication
+        (b'POST', b'/pair-verify'): _handle_pair_verify,    # Real X25519 key exchange
+        (b'POST', b'/fp-setup'): _handle_fp_setup,          # FairPlay setup
+        (b'POST', b'/feedback'): _handle_empty,
+    }
+
 
 # Standalone test
 if __name__ == "__main__":
@@ -1104,8 +1752,7 @@ if __name__ == "__main__":
     try:
         receiver.start()
         print("AirPlay receiver running. Press Ctrl+C to stop.")
-        while True:
-            time.sleep(1)
+        threading.Event().wait()
     except KeyboardInterrupt:
         receiver.stop()
         print("\nAirPlay receiver stopped")
@@ -7,7 +7,8 @@ Advertises the receiver as a Cast target using mDNS/Zeroconf
 import socket
 import uuid
 import logging
-from zeroconf import ServiceInfo, Zeroconf
+from zeroconf import ServiceInfo
+from mdns_discovery import get_local_ip, get_zeroconf, release_zeroconf
 
 logger = logging.getLogger(__name__)
 
@@ -37,23 +38,10 @@ class CastDiscovery:
         self.device_id = str(uuid.uuid4())
 
         # Get local IP address
-        self.ip_address = self._get_local_ip()
+        self.ip_address = get_local_ip()
 
         logger.info(f"Cast Discovery initialized for {friendly_name} at {self.ip_address}:{port}")
 
-    def _get_local_ip(self):
-        """Get the local IP address of this machine"""
-        try:
-            # Create a socket to determine the local IP
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except Exception as e:
-            logger.warning(f"Could not determine local IP: {e}")
-            return "127.0.0.1"
-
     def start(self):
         """Start advertising as a Cast receiver"""
         try:
@@ -99,9 +87,14 @@ class CastDiscovery:
                 server=f"{socket.gethostname()}.local."
             )
 
-            # Start zeroconf
-            self.zeroconf = Zeroconf()
-            self.zeroconf.register_service(self.service_info)
+            # Register on the process-wide zeroconf instance
+            self.zeroconf = get_zeroconf()
+            try:
+                self.zeroconf.register_service(self.service_info)
+            except Exception:
+                self.zeroconf = None
+                release_zeroconf()
+                raise
 
             logger.info(f"✓ Cast discovery service started")
             logger.info(f"  Service: {service_name}")
@@ -131,8 +124,8 @@ class CastDiscovery:
             if self.zeroconf and self.service_info:
                 logger.info("Stopping Cast discovery service...")
                 self.zeroconf.unregister_service(self.service_info)
-                self.zeroconf.close()
                 self.zeroconf = None
+                release_zeroconf()
                 self.service_info = None
                 logger.info("Cast discovery stopped")
         except Exception as e:
@@ -6,6 +6,7 @@ Advertises the WebRTC server so Chrome/Chromebook can discover it
 
 import socket
 import logging
+import threading
 from typing import Optional
 
 try:
@@ -18,6 +19,87 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait on the route lookup before falling back to the hostname
+_LOCAL_IP_TIMEOUT = 0.2
+
+# Interface address found by get_local_ip(); the loopback fallback is never
+# stored, so a network that comes up later is still picked up
+_local_ip: Optional[str] = None
+
+
+# Zeroconf instance shared by every advertiser in the process, so there is
+# one set of mDNS sockets and threads; closed when the last user releases it
+_shared_zeroconf: Optional["Zeroconf"] = None
+_shared_zeroconf_refs = 0
+_shared_zeroconf_lock = threading.Lock()
+
+
+def get_zeroconf() -> "Zeroconf":
+    """
+    Get the process-wide Zeroconf instance, creating it on first use
+
+    Each call must be paired with release_zeroconf().
+
+    Returns:
+        Shared Zeroconf instance
+    """
+    global _shared_zeroconf, _shared_zeroconf_refs
+    with _shared_zeroconf_lock:
+        if _shared_zeroconf is None:
+            _shared_zeroconf = Zeroconf()
+        _shared_zeroconf_refs += 1
+        return _shared_zeroconf
+
+
+def release_zeroconf():
+    """Drop a reference taken with get_zeroconf(), closing the instance after the last one"""
+    global _shared_zeroconf, _shared_zeroconf_refs
+    with _shared_zeroconf_lock:
+        if _shared_zeroconf_refs == 0:
+            return
+        _shared_zeroconf_refs -= 1
+        if _shared_zeroconf_refs == 0:
+            _shared_zeroconf.close()
+            _shared_zeroconf = None
+
+
+def get_local_ip() -> str:
+    """
+    Get the IP of the outbound network interface
+
+    Shared by the mDNS, Cast and AirPlay advertisers. A found address is
+    kept for the rest of the process; the 127.0.0.1 fallback is not, so the
+    next call looks again.
+
+    Returns:
+        IPv4 address string, or 127.0.0.1 if none could be found
+    """
+    global _local_ip
+    if _local_ip is not None:
+        return _local_ip
+
+    try:
+        # Connecting a UDP socket sends no packets; it only selects a route
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(_LOCAL_IP_TIMEOUT)
+            s.connect(("8.8.8.8", 80))
+            _local_ip = s.getsockname()[0]
+            return _local_ip
+    except OSError as e:
+        logger.debug(f"Route lookup for local IP failed: {e}")
+
+    try:
+        # No default route - use the first non-loopback address of this host
+        for *_, sockaddr in socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET):
+            if not sockaddr[0].startswith("127."):
+                _local_ip = sockaddr[0]
+                return _local_ip
+    except OSError as e:
+        logger.debug(f"Hostname lookup for local IP failed: {e}")
+
+    logger.warning("Could not determine local IP, using 127.0.0.1")
+    return "127.0.0.1"
+
 
 class MDNSAdvertiser:
     """
@@ -51,13 +133,10 @@ class MDNSAdvertiser:
 
         try:
             logger.info("Starting mDNS service advertisement...")
-            self.zeroconf = Zeroconf()
+            self.zeroconf = get_zeroconf()
 
             # Get local IP address
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            s.close()
+            local_ip = get_local_ip()
 
             addresses = [socket.inet_aton(local_ip)]
 
@@ -112,6 +191,15 @@ class MDNSAdvertiser:
 
         except Exception as e:
             logger.error(f"Failed to start mDNS advertising: {e}")
+            if self.zeroconf:
+                for service in self.services:
+                    try:
+                        self.zeroconf.unregister_service(service)
+                    except Exception:
+                        pass
+                self.services = []
+                self.zeroconf = None
+                release_zeroconf()
             import traceback
             logger.debug(traceback.format_exc())
             return False
@@ -131,8 +219,9 @@ class MDNSAdvertiser:
                 except Exception as e:
                     logger.warning(f"Error unregistering service: {e}")
 
-            self.zeroconf.close()
+            # Other advertisers may still be using the shared instance
             self.zeroconf = None
+            release_zeroconf()
             self.services = []
             self.running = False
 
@@ -6,13 +6,18 @@ Supports AirPlay mirroring from iOS devices
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 from aiohttp import web
-from aiortc import RTCPeerConnection, RTCSessionDescription, VideoStreamTrack
+from aiortc import RTCConfiguration, RTCPeerConnection, RTCRtpSender, RTCSessionDescription, VideoStreamTrack
+from aiortc.contrib.media import MediaRelay
+from aiortc.mediastreams import MediaStreamError
 import cv2
 import numpy as np
 from threading import Lock
+from dataclasses import dataclass
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 import time
 import ssl
 import os
@@ -26,6 +31,35 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# The log format has no file/line fields, so skip the caller lookup on every record
+logging._srcfile = None
+
+# Faster JSON encoding/decoding (optional, falls back to the json module)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    logger.debug("orjson module loaded successfully")
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Faster event loop for the web server (optional, not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+    logger.debug("uvloop module loaded successfully")
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Senders are on the local network, so host candidates are enough; without a
+# configuration aiortc also gathers from a public STUN server on every offer
+_RTC_CONFIGURATION = RTCConfiguration(iceServers=[])
+
+# Received video codecs in order of preference: H.264 first (hardware encoded
+# on Chromebooks and phones), VP8 kept for senders without H.264
+_VIDEO_CODEC_PREFERENCES = sorted(
+    RTCRtpSender.getCapabilities('video').codecs,
+    key=lambda codec: codec.mimeType.lower() != 'video/h264'
+)
 
 # Global instances (will be initialized in run_server)
 airplay_receiver = None
@@ -53,14 +87,86 @@ def get_executable_dir():
         return os.path.dirname(os.path.abspath(__file__))
 
 
+def json_dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def json_loads(data: bytes):
+    """Parse a JSON request body"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_response(obj, status=200):
+    """Build an application/json response"""
+    return web.Response(body=json_dumps(obj), content_type="application/json", status=status)
+
+
+def video_frame_to_bgr(video_frame):
+    """
+    Convert an av.VideoFrame to a BGR ndarray
+
+    The result is a strided view of the converted frame's buffer, so rows
+    padded to the codec's alignment (common for widths that are not a
+    multiple of 16) are not compacted with another full-frame copy.
+    """
+    bgr = video_frame.reformat(format='bgr24')
+    plane = bgr.planes[0]
+    rows = np.frombuffer(plane, np.uint8, count=bgr.height * plane.line_size)
+    rows = rows.reshape(bgr.height, plane.line_size)
+    return rows[:, :bgr.width * 3].reshape(bgr.height, bgr.width, 3)
+
+
+@dataclass(slots=True)
+class StreamState:
+    """
+    One incoming stream
+
+    Each stream has a single producer, so frame and timestamp are replaced by
+    plain attribute assignment without a lock. frame is a BGR ndarray, or a
+    decoded av.VideoFrame that is converted when first read.
+    """
+    name: str
+    frame: Any = None
+    timestamp: float = 0.0
+    # (av.VideoFrame, BGR ndarray) of the last conversion; written by readers only
+    converted: Optional[Tuple[Any, np.ndarray]] = None
+
+
+class StreamSnapshot(NamedTuple):
+    """Read-only view of a stream, as returned by StreamManager.get_all_streams()"""
+    name: str
+    timestamp: float
+    frame: Optional[np.ndarray]  # BGR
+
+
 class StreamManager:
     """Manages multiple incoming video streams"""
 
     def __init__(self, max_streams=8):
         self.max_streams = max_streams
-        self.streams = {}  # {client_id: {'frame': np.array, 'name': str, 'timestamp': float}}
-        self.lock = Lock()
+        self.streams: Dict[str, StreamState] = {}
+        self.lock = Lock()  # Guards adding/removing streams, not frame updates
         self.pcs = {}  # {client_id: RTCPeerConnection}
+        self._listeners = []  # Called (from any thread) after a stream is added or removed
+
+    def add_listener(self, callback):
+        """Call callback() whenever a stream is added or removed"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self._listeners.remove(callback)
+
+    def _notify(self):
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception as e:
+                logger.debug("Stream listener failed: %s", e)
 
     def add_stream(self, client_id, name_or_frame, name=None):
         """
@@ -75,50 +181,83 @@ class StreamManager:
             # Determine if this is WebRTC (name_or_frame is string) or AirPlay (name_or_frame is frame)
             if isinstance(name_or_frame, str):
                 # WebRTC style: add_stream(client_id, name)
-                self.streams[client_id] = {
-                    'frame': None,
-                    'name': name_or_frame,
-                    'timestamp': time.time()
-                }
+                self.streams[client_id] = StreamState(name_or_frame, None, time.time())
             else:
                 # AirPlay style: add_stream(client_id, frame, name)
-                self.streams[client_id] = {
-                    'frame': name_or_frame,
-                    'name': name if name else 'AirPlay Device',
-                    'timestamp': time.time()
-                }
-            return True
+                self.streams[client_id] = StreamState(name if name else 'AirPlay Device', name_or_frame, time.time())
+        self._notify()
+        return True
 
     def update_frame(self, client_id, frame):
-        """Update frame for a stream (WebRTC interface)"""
-        with self.lock:
-            if client_id in self.streams:
-                self.streams[client_id]['frame'] = frame
-                self.streams[client_id]['timestamp'] = time.time()
+        """
+        Update frame for a stream (WebRTC interface)
+
+        Args:
+            client_id: Stream to update
+            frame: BGR ndarray, or a decoded av.VideoFrame that is converted
+                only when the frame is read
+        """
+        stream = self.streams.get(client_id)
+        if stream is not None:
+            stream.frame = frame
+            stream.timestamp = time.time()
 
     def update_stream(self, client_id, frame):
         """Update frame for a stream (AirPlay interface - alias for update_frame)"""
         self.update_frame(client_id, frame)
 
+    @staticmethod
+    def _bgr_frame(stream):
+        """Get a stream's current frame as BGR, converting a decoded av.VideoFrame once"""
+        frame = stream.frame
+        if frame is None or isinstance(frame, np.ndarray):
+            return frame
+        converted = stream.converted
+        if converted is not None and converted[0] is frame:
+            return converted[1]
+        bgr = video_frame_to_bgr(frame)
+        stream.converted = (frame, bgr)
+        return bgr
+
+    def get_bgr(self, client_id):
+        """Get the latest BGR frame for a stream, or None"""
+        stream = self.streams.get(client_id)
+        return self._bgr_frame(stream) if stream is not None else None
+
     def remove_stream(self, client_id):
         with self.lock:
-            if client_id in self.streams:
-                del self.streams[client_id]
+            removed = self.streams.pop(client_id, None) is not None
             if client_id in self.pcs:
                 del self.pcs[client_id]
+        if removed:
+            self._notify()
 
     def get_all_streams(self):
         with self.lock:
-            return {k: v.copy() for k, v in self.streams.items()}
+            streams = list(self.streams.items())
+        return {
+            client_id: StreamSnapshot(stream.name, stream.timestamp, self._bgr_frame(stream))
+            for client_id, stream in streams
+        }
+
+    def get_stream_names(self):
+        """Get {client_id: name} for all streams without converting their frames"""
+        with self.lock:
+            return {client_id: stream.name for client_id, stream in self.streams.items()}
 
     def get_stream_count(self):
-        with self.lock:
-            return len(self.streams)
+        return len(self.streams)
 
 
 # Global stream manager
 stream_manager = StreamManager(max_streams=8)
 
+# Shares each incoming track with its consumer without buffering frames
+relay = MediaRelay()
+
+# Running consume_track tasks
+consumer_tasks = set()
+
 
 class VideoFrameTrack(VideoStreamTrack):
     """Custom video track that processes incoming frames"""
@@ -132,67 +271,233 @@ class VideoFrameTrack(VideoStreamTrack):
     async def recv(self):
         frame = await self.track.recv()
 
-        # Convert frame to numpy array
-        img = frame.to_ndarray(format="bgr24")
-
-        # Update the stream manager with the new frame
-        self.stream_manager.update_frame(self.client_id, img)
+        # Hand over the decoded frame as is; the stream manager converts it
+        # only when the frame is displayed
+        self.stream_manager.update_frame(self.client_id, frame)
 
         return frame
 
 
+def sdp_fingerprint(sdp):
+    """
+    Get the DTLS certificate fingerprint from an SDP
+
+    Args:
+        sdp: Session description text
+
+    Returns:
+        The first a=fingerprint value (lowercased), or None
+    """
+    for line in sdp.splitlines():
+        if line.startswith('a=fingerprint:'):
+            return line[len('a=fingerprint:'):].strip().lower()
+    return None
+
+
+# Result of enable_hw_h264_decoding(); aiortc's decoder factory is only
+# patched once per process, however often the server is restarted
+_hw_h264_decoding: Optional[bool] = None
+
+
+def enable_hw_h264_decoding():
+    """
+    Make aiortc decode received H.264 on a hardware decoder when one works
+
+    aiortc has no decoder setting, so its receiver's decoder factory is
+    wrapped. Each stream falls back to aiortc's software decoder if the
+    hardware one fails; VP8 is unaffected.
+
+    Returns:
+        True if a hardware decoder is in use
+    """
+    global _hw_h264_decoding
+    if _hw_h264_decoding is None:
+        _hw_h264_decoding = _install_hw_h264_decoder()
+    return _hw_h264_decoding
+
+
+def _install_hw_h264_decoder():
+    """Patch aiortc's decoder factory for hardware H.264 (see enable_hw_h264_decoding)"""
+    try:
+        import av
+        from aiortc import rtcrtpreceiver
+        from aiortc.codecs.h264 import H264Decoder
+        from aiortc.mediastreams import VIDEO_TIME_BASE
+        from airplay_receiver import open_hw_h264_decoder
+    except ImportError as e:
+        logger.debug(f"Hardware H.264 decoding unavailable: {e}")
+        return False
+
+    # The decoder opened to probe for hardware support serves the first stream
+    probed = [open_hw_h264_decoder()]
+    if probed[0] is None:
+        return False
+
+    class HardwareH264Decoder(H264Decoder):
+        def __init__(self):
+            # aiortc's software codec is only created if the hardware one fails
+            self.codec = None
+            self.hw_codec = probed.pop() if probed else open_hw_h264_decoder()
+            if self.hw_codec is None:
+                super().__init__()
+
+        def decode(self, encoded_frame):
+            if self.hw_codec is not None:
+                try:
+                    packet = av.Packet(encoded_frame.data)
+                    packet.pts = encoded_frame.timestamp
+                    packet.time_base = VIDEO_TIME_BASE
+                    return list(self.hw_codec.decode(packet))
+                except Exception as e:
+                    # Some hardware decoders open fine but only fail on real data
+                    logger.warning(f"Hardware H.264 decode failed, using software decoder: {e}")
+                    self.hw_codec = None
+                    super().__init__()
+            return super().decode(encoded_frame)
+
+    get_decoder = rtcrtpreceiver.get_decoder
+
+    def get_hw_decoder(codec):
+        if codec.mimeType.lower() == 'video/h264':
+            return HardwareH264Decoder()
+        return get_decoder(codec)
+
+    rtcrtpreceiver.get_decoder = get_hw_decoder
+    return True
+
+
+class OfferRequest(NamedTuple):
+    """Fields of an /offer request body"""
+    sdp: str
+    type: str
+    client_id: str
+    client_name: str
+
+
+def parse_offer(body):
+    """
+    Parse an /offer request body
+
+    Args:
+        body: Raw JSON request body
+
+    Returns:
+        OfferRequest, or None if the body is not a valid offer
+    """
+    try:
+        params = json_loads(body)
+        sdp = params["sdp"]
+        client_id = params["client_id"]
+        client_name = params.get("client_name") or f"Client {client_id[:8]}"
+        request = OfferRequest(sdp, params["type"], client_id, client_name)
+    except (ValueError, TypeError, KeyError):
+        return None
+    if not all(isinstance(field, str) for field in request):
+        return None
+    return request
+
+
+def answer_response(pc):
+    """JSON response carrying a peer connection's local description"""
+    return json_response({
+        "sdp": pc.localDescription.sdp,
+        "type": pc.localDescription.type
+    })
+
+
 async def offer(request):
     """Handle WebRTC offer from client"""
-    params = await request.json()
-    offer_sdp = RTCSessionDescription(sdp=params["sdp"], type=params["type"])
-    client_id = params.get("client_id")
-    client_name = params.get("client_name", f"Client {client_id[:8]}")
-
-    logger.info(f"Received offer from {client_name} ({client_id})")
+    params = parse_offer(await request.read())
+    if params is None:
+        return json_response({"error": "Invalid offer"}, status=400)
+    offer_sdp = RTCSessionDescription(sdp=params.sdp, type=params.type)
+    client_id = params.client_id
+    client_name = params.client_name
+
+    logger.info("Received offer from %s (%s)", client_name, client_id)
+
+    existing_pc = stream_manager.pcs.get(client_id)
+    if existing_pc is not None:
+        # An offer from the same peer (same DTLS certificate) on a live
+        # connection is a renegotiation: answer it on the existing connection
+        # instead of repeating ICE and the DTLS handshake
+        if (existing_pc.connectionState == "connected"
+                and existing_pc.remoteDescription is not None
+                and sdp_fingerprint(existing_pc.remoteDescription.sdp) == sdp_fingerprint(offer_sdp.sdp)):
+            logger.info("Renegotiating existing connection for %s", client_name)
+            await existing_pc.setRemoteDescription(offer_sdp)
+            answer = await existing_pc.createAnswer()
+            await existing_pc.setLocalDescription(answer)
+            return answer_response(existing_pc)
+
+        # A new peer connection from a reconnecting client replaces the old one
+        logger.info("Replacing previous connection for %s", client_name)
+        stream_manager.remove_stream(client_id)
+        await existing_pc.close()
 
     # Check if we can accept more streams
     if not stream_manager.add_stream(client_id, client_name):
-        return web.Response(
-            content_type="application/json",
-            text=json.dumps({"error": "Maximum streams reached"}),
-            status=503
-        )
+        return json_response({"error": "Maximum streams reached"}, status=503)
 
     # Create peer connection
-    pc = RTCPeerConnection()
+    pc = RTCPeerConnection(configuration=_RTC_CONFIGURATION)
     stream_manager.pcs[client_id] = pc
 
+    def release_stream():
+        # Events from a replaced connection must not remove its successor's stream
+        if stream_manager.pcs.get(client_id) is pc:
+            stream_manager.remove_stream(client_id)
+
     @pc.on("connectionstatechange")
     async def on_connectionstatechange():
-        logger.info(f"Connection state for {client_name}: {pc.connectionState}")
+        logger.info("Connection state for %s: %s", client_name, pc.connectionState)
         if pc.connectionState in ["failed", "closed"]:
-            stream_manager.remove_stream(client_id)
+            release_stream()
             await pc.close()
 
     @pc.on("track")
     async def on_track(track):
-        logger.info(f"Received track from {client_name}: {track.kind}")
+        logger.info("Received track from %s: %s", client_name, track.kind)
         if track.kind == "video":
-            # Wrap the track to process frames
-            video_track = VideoFrameTrack(track, client_id, stream_manager)
+            # Wrap the track to process frames. The unbuffered relay hands
+            # over only the newest frame, so a consumer that falls behind
+            # skips frames instead of letting a backlog build up.
+            video_track = VideoFrameTrack(relay.subscribe(track, buffered=False), client_id, stream_manager)
 
             # Create a task to consume the track and process frames
             async def consume_track():
                 try:
                     while True:
                         await video_track.recv()
+                except MediaStreamError:
+                    logger.info("Track ended for %s", client_name)
                 except Exception as e:
-                    logger.info(f"Track ended for {client_name}: {e}")
-                    stream_manager.remove_stream(client_id)
+                    logger.error("Frame processing failed for %s: %s", client_name, e, exc_info=True)
+                finally:
+                    release_stream()
 
-            # Start consuming frames
-            asyncio.create_task(consume_track())
+            # Start consuming frames (the event loop only keeps a weak
+            # reference to the task, so hold on to it until it finishes)
+            task = asyncio.create_task(consume_track())
+            consumer_tasks.add(task)
+            task.add_done_callback(consumer_tasks.discard)
 
             # Keep track alive
             @track.on("ended")
             async def on_ended():
-                logger.info(f"Track ended for {client_name}")
-                stream_manager.remove_stream(client_id)
+                logger.info("Track ended for %s", client_name)
+                release_stream()
+
+    # aiortc matches the offer's m-lines to existing transceivers by kind, so
+    # creating them first makes the codec choice and audio refusal apply to
+    # this negotiation. Only offered kinds get one: a transceiver left
+    # unmatched breaks the answer. Audio is never played, so declining it
+    # keeps the sender from transmitting it and aiortc from decoding it.
+    offered_kinds = {line[2:].split(' ', 1)[0] for line in offer_sdp.sdp.splitlines() if line.startswith('m=')}
+    if "video" in offered_kinds:
+        pc.addTransceiver("video", direction="recvonly").setCodecPreferences(_VIDEO_CODEC_PREFERENCES)
+    if "audio" in offered_kinds:
+        pc.addTransceiver("audio", direction="inactive")
 
     # Set remote description
     await pc.setRemoteDescription(offer_sdp)
@@ -201,18 +506,12 @@ async def offer(request):
     answer = await pc.createAnswer()
     await pc.setLocalDescription(answer)
 
-    return web.Response(
-        content_type="application/json",
-        text=json.dumps({
-            "sdp": pc.localDescription.sdp,
-            "type": pc.localDescription.type
-        })
-    )
+    return answer_response(pc)
 
 
 async def disconnect(request):
     """Handle client disconnect"""
-    params = await request.json()
+    params = json_loads(await request.read())
     client_id = params.get("client_id")
 
     if client_id in stream_manager.pcs:
@@ -220,47 +519,153 @@ async def disconnect(request):
         await pc.close()
 
     stream_manager.remove_stream(client_id)
-    logger.info(f"Client {client_id} disconnected")
+    logger.info("Client %s disconnected", client_id)
+
+    return json_response({"status": "disconnected"})
 
-    return web.Response(
-        content_type="application/json",
-        text=json.dumps({"status": "disconnected"})
-    )
+
+def status_payload():
+    """Current streaming status, as served by /status and /status/stream"""
+    return {
+        "active_streams": stream_manager.get_stream_count(),
+        "max_streams": stream_manager.max_streams
+    }
 
 
 async def status(request):
     """Return current streaming status"""
-    return web.Response(
-        content_type="application/json",
-        text=json.dumps({
-            "active_streams": stream_manager.get_stream_count(),
-            "max_streams": stream_manager.max_streams
-        })
-    )
+    return json_response(status_payload())
+
+
+class StatusBroadcast:
+    """Wakes /status/stream handlers when the set of streams changes"""
+
+    def __init__(self):
+        # Replaced on every change, so each waiter sees the change it awaited
+        # and several changes before a handler runs coalesce into one event
+        self.changed = asyncio.Event()
+        self.closed = False
+        self.listener = None
+
+    def notify(self):
+        """Signal a change (call on the app's event loop)"""
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+    def close(self):
+        """End all status streams"""
+        self.closed = True
+        self.notify()
+
+
+_STATUS_BROADCAST_KEY = web.AppKey("status_broadcast", StatusBroadcast)
+
+# Seconds between SSE keepalive comments when nothing changes; the write also
+# notices clients that went away
+_STATUS_KEEPALIVE = 15
+
+
+async def status_stream(request):
+    """Push streaming status as Server-Sent Events whenever streams come or go"""
+    broadcast = request.app[_STATUS_BROADCAST_KEY]
+    response = web.StreamResponse(headers={'Cache-Control': 'no-cache'})
+    response.content_type = 'text/event-stream'
+    await response.prepare(request)
+
+    last_payload = None
+    try:
+        while not broadcast.closed:
+            # Take the event before reading the status so no change is missed
+            changed = broadcast.changed
+            payload = json_dumps(status_payload())
+            if payload != last_payload:
+                await response.write(b"data: " + payload + b"\n\n")
+                last_payload = payload
+            try:
+                await asyncio.wait_for(changed.wait(), _STATUS_KEEPALIVE)
+            except asyncio.TimeoutError:
+                await response.write(b": keepalive\n\n")
+    except ConnectionResetError:
+        pass
+    return response
+
+
+async def start_status_broadcast(app):
+    """Forward stream changes from any thread to this app's status streams"""
+    loop = asyncio.get_running_loop()
+    broadcast = app[_STATUS_BROADCAST_KEY]
+    broadcast.listener = lambda: loop.call_soon_threadsafe(broadcast.notify)
+    stream_manager.add_listener(broadcast.listener)
+
+
+async def stop_status_broadcast(app):
+    broadcast = app[_STATUS_BROADCAST_KEY]
+    if broadcast.listener:
+        stream_manager.remove_listener(broadcast.listener)
+        broadcast.listener = None
+    broadcast.close()
+
+
+# Bundled HTML pages; a frozen build reads them into memory once in
+# create_app(), a source checkout serves them from disk with sendfile
+_HTML_PAGES = ('client.html', 'cast_receiver.html', 'cast_sender.html')
+_HTML_PAGES_KEY = web.AppKey("html_pages", dict)
+
+
+def load_html_pages():
+    """
+    Read the bundled HTML pages
+
+    Returns:
+        {filename: (body, etag)} for every page that could be read
+    """
+    pages = {}
+    for filename in _HTML_PAGES:
+        try:
+            with open(os.path.join(get_base_path(), filename), 'rb') as f:
+                body = f.read()
+        except OSError as e:
+            logger.warning(f"Could not load {filename}: {e}")
+            continue
+        pages[filename] = (body, hashlib.sha1(body).hexdigest())
+    return pages
+
+
+def html_response(request, filename):
+    """Serve an HTML page, answering 304 when the client's copy is current"""
+    pages = request.app.get(_HTML_PAGES_KEY)
+    if pages is None:
+        # FileResponse handles ETag/Last-Modified itself and can sendfile()
+        # the page from the page cache; edits show up without a restart
+        return web.FileResponse(os.path.join(get_base_path(), filename))
+
+    page = pages.get(filename)
+    if page is None:
+        raise web.HTTPNotFound()
+
+    body, etag = page
+    if any(tag.value in (etag, '*') for tag in request.if_none_match or ()):
+        response = web.Response(status=304)
+    else:
+        response = web.Response(body=body, content_type='text/html', charset='utf-8')
+    response.etag = etag
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
 
 
 async def index(request):
     """Serve the client HTML page"""
-    client_html_path = os.path.join(get_base_path(), 'client.html')
-    with open(client_html_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    return web.Response(content_type='text/html', text=content)
+    return html_response(request, 'client.html')
 
 
 async def cast_receiver(request):
     """Serve the Cast receiver HTML page"""
-    cast_receiver_path = os.path.join(get_base_path(), 'cast_receiver.html')
-    with open(cast_receiver_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    return web.Response(content_type='text/html', text=content)
+    return html_response(request, 'cast_receiver.html')
 
 
 async def cast_sender(request):
     """Serve the Cast sender HTML page"""
-    cast_sender_path = os.path.join(get_base_path(), 'cast_sender.html')
-    with open(cast_sender_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    return web.Response(content_type='text/html', text=content)
+    return html_response(request, 'cast_sender.html')
 
 
 async def on_shutdown(app):
@@ -268,11 +673,16 @@ async def on_shutdown(app):
     logger.info("Shutting down, closing all connections...")
     for client_id, pc in list(stream_manager.pcs.items()):
         await pc.close()
+    for task in list(consumer_tasks):
+        task.cancel()
 
 
 def create_app():
     """Create and configure the web application"""
     app = web.Application()
+    if getattr(sys, 'frozen', False):
+        # Files under _MEIPASS may be removed while running, so keep copies
+        app[_HTML_PAGES_KEY] = load_html_pages()
     app.router.add_get('/', index)
     app.router.add_get('/cast_receiver', cast_receiver)
     app.router.add_get('/cast_receiver.html', cast_receiver)
@@ -281,6 +691,10 @@ def create_app():
     app.router.add_post('/offer', offer)
     app.router.add_post('/disconnect', disconnect)
     app.router.add_get('/status', status)
+    app.router.add_get('/status/stream', status_stream)
+    app[_STATUS_BROADCAST_KEY] = StatusBroadcast()
+    app.on_startup.append(start_status_broadcast)
+    app.on_shutdown.append(stop_status_broadcast)
     app.on_shutdown.append(on_shutdown)
     return app
 
@@ -399,7 +813,13 @@ def run_server(host='0.0.0.0', port=8080, use_ssl=True, enable_airplay=True, ena
 
         logger.info("WebRTC camera streaming available for all mobile devices at the web interface")
 
-    web.run_app(app, host=host, port=port, ssl_context=ssl_context, handle_signals=False)
+    if enable_hw_h264_decoding():
+        logger.info("✓ Hardware H.264 decoding enabled for WebRTC streams")
+
+    # run_app creates its own loop; pick uvloop explicitly (each server thread
+    # creates its own loop, no global event loop policy is installed)
+    loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else None
+    web.run_app(app, host=host, port=port, ssl_context=ssl_context, handle_signals=False, loop=loop)
 
     # Cleanup on exit
     logger.info("Shutting down services...")
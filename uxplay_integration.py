@@ -4,6 +4,7 @@ Improved UxPlay Integration Module with Real Video Capture
 Captures actual video frames from UxPlay using various methods
 """
 
+import functools
 import subprocess
 import threading
 import time
@@ -16,6 +17,7 @@ import cv2
 from typing import Optional
 import socket
 import struct
+import sys
 
 # Enhanced logging
 LOG_LEVEL = os.getenv('DEBUG', 'INFO')
@@ -25,6 +27,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Largest UDP datagram; the receive buffer keeps this much room past a frame
+_UDP_MAX_DATAGRAM = 65536
+
+# Receive buffer for the raw video stream (about 6 frames of 1280x720 RGB)
+_UDP_RCVBUF_SIZE = 2**24
+
+# Linux's SO_RCVBUFFORCE (not exported by the socket module): lets root
+# exceed net.core.rmem_max
+_SO_RCVBUFFORCE = 33 if sys.platform.startswith('linux') else None
+
+# UxPlay log lines that mark a device authenticating, mirroring starting and
+# mirroring stopping, matched in a single search per line (on raw bytes, so
+# lines are only decoded when logged or when a device name is captured)
+_UXPLAY_EVENT_RE = re.compile(
+    rb'(?P<auth>Authenticated\s+(?P<client>[^\s]+))'
+    rb'|(?P<start>raop_rtp_mirror starting mirroring)'
+    rb'|(?P<stop>raop_rtp_mirror.*stopped)'
+)
+
+# Pipe buffer and read size for UxPlay's output
+_UXPLAY_READ_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=None)
+def _gradient_background(top, delta):
+    """
+    1280x720 vertical gradient, built once per color pair
+
+    Args:
+        top: (b, g, r) of the first row
+        delta: (b, g, r) added by the last row
+
+    Returns:
+        Read-only BGR frame; copy it before drawing on it
+    """
+    ratio = np.arange(720)[:, None] / 720
+    rows = (np.array(top) + ratio * np.array(delta)).astype(np.uint8)
+    frame = np.empty((720, 1280, 3), dtype=np.uint8)
+    frame[:] = rows[:, None, :]
+    frame.flags.writeable = False
+    return frame
+
+
+def _text_x(text, font_scale, thickness):
+    """x position that centers text (FONT_HERSHEY_SIMPLEX) on a 1280-wide frame"""
+    text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)[0]
+    return (1280 - text_size[0]) // 2
+
+
+# Only for text that repeats (titles and fixed messages); per-frame strings
+# such as the placeholder counter use _text_x so they do not evict these
+_centered_text_x = functools.lru_cache(maxsize=256)(_text_x)
+
 
 class UxPlayIntegration:
     """
@@ -147,8 +202,7 @@ class UxPlayIntegration:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=_UXPLAY_READ_SIZE
             )
 
             self.running = True
@@ -179,8 +233,7 @@ class UxPlayIntegration:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=_UXPLAY_READ_SIZE
             )
 
             self.running = True
@@ -200,7 +253,7 @@ class UxPlayIntegration:
         """Start UDP socket to receive video frames from GStreamer"""
         try:
             self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 2**24)  # 16MB buffer
+            self._set_receive_buffer(self.udp_socket)
             self.udp_socket.bind(('127.0.0.1', self.udp_port))
             self.udp_socket.settimeout(1.0)
 
@@ -215,6 +268,39 @@ class UxPlayIntegration:
             logger.debug("Exception details:", exc_info=True)
             self.udp_socket = None
 
+    @staticmethod
+    def _set_receive_buffer(sock: socket.socket):
+        """
+        Request a large UDP receive buffer and warn if the OS caps it
+
+        Linux silently clamps SO_RCVBUF to net.core.rmem_max (about 208 KB by
+        default), which holds less than one frame, so packets are dropped on
+        any scheduling delay.
+        """
+        def granted() -> int:
+            size = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            # Linux reports double the granted size (bookkeeping overhead included)
+            return size // 2 if sys.platform.startswith('linux') else size
+
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _UDP_RCVBUF_SIZE)
+        if granted() >= _UDP_RCVBUF_SIZE:
+            return
+
+        if _SO_RCVBUFFORCE is not None:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, _SO_RCVBUFFORCE, _UDP_RCVBUF_SIZE)
+            except OSError as e:
+                logger.debug(f"SO_RCVBUFFORCE not permitted: {e}")
+
+        actual = granted()
+        if actual < _UDP_RCVBUF_SIZE:
+            logger.warning(f"UDP receive buffer limited to {actual} bytes (requested {_UDP_RCVBUF_SIZE}); "
+                           f"video frames may be dropped")
+            if sys.platform.startswith('linux'):
+                logger.warning("To raise the limit, run:")
+                logger.warning(f"  sudo sysctl -w net.core.rmem_max={_UDP_RCVBUF_SIZE}")
+                logger.warning("  sudo sysctl -w net.core.netdev_max_backlog=5000")
+
     def _capture_udp_frames(self):
         """Capture video frames from UDP stream"""
         logger.info("Starting UDP frame capture...")
@@ -223,32 +309,40 @@ class UxPlayIntegration:
         frame_height = 720
         frame_size = frame_width * frame_height * 3  # RGB
 
-        buffer = b''
+        # Packets are received straight into one preallocated buffer, and the
+        # RGB frame is read through a view of it, so assembling a frame copies
+        # nothing (appending to a bytes object copied the whole partial frame
+        # for every packet)
+        buffer = bytearray(frame_size + _UDP_MAX_DATAGRAM)
+        view = memoryview(buffer)
+        rgb = np.frombuffer(buffer, dtype=np.uint8, count=frame_size).reshape((frame_height, frame_width, 3))
+        filled = 0
 
         try:
             while self.running and self.udp_socket:
                 try:
                     # Receive UDP packet
-                    data, addr = self.udp_socket.recvfrom(65536)
-                    buffer += data
-
-                    # Process complete frames
-                    while len(buffer) >= frame_size:
-                        frame_data = buffer[:frame_size]
-                        buffer = buffer[frame_size:]
-
-                        # Convert to numpy array
-                        frame = np.frombuffer(frame_data, dtype=np.uint8)
-                        frame = frame.reshape((frame_height, frame_width, 3))
-
-                        # Convert RGB to BGR for OpenCV
-                        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+                    filled += self.udp_socket.recv_into(view[filled:], _UDP_MAX_DATAGRAM)
+
+                    # Process a complete frame
+                    if filled >= frame_size:
+                        # Convert RGB to BGR for OpenCV (a new array, so the
+                        # buffer can be reused while consumers hold the frame)
+                        frame = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+                        # Every client gets this same array; a consumer that
+                        # wants to draw on it has to copy it first
+                        frame.flags.writeable = False
+
+                        # Keep the start of the next frame
+                        leftover = filled - frame_size
+                        view[:leftover] = view[frame_size:filled]
+                        filled = leftover
 
                         # Update all active clients with this frame
                         for device_name, client_info in list(self.active_clients.items()):
                             self.stream_manager.update_stream(client_info['client_id'], frame)
 
-                        logger.debug(f"Captured frame: {frame.shape}")
+                        logger.debug("Captured frame: %s", frame.shape)
 
                 except socket.timeout:
                     continue
@@ -293,33 +387,26 @@ class UxPlayIntegration:
         """Monitor UxPlay stdout/stderr for connection events"""
         logger.info("Monitoring UxPlay output...")
 
-        connection_pattern = re.compile(r'raop_rtp_mirror starting mirroring')
-        client_name_pattern = re.compile(r'Authenticated\s+([^\s]+)')
-        disconnect_pattern = re.compile(r'raop_rtp_mirror.*stopped')
-
         current_client = None
 
         try:
-            while self.running and self.process:
-                line = self.process.stdout.readline()
-                if not line:
-                    break
+            for line in self._output_lines():
+                # Log UxPlay output
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("UxPlay: %s", line.decode('utf-8', 'replace'))
 
-                line = line.strip()
-                if not line:
+                match = _UXPLAY_EVENT_RE.search(line)
+                if not match:
                     continue
-
-                # Log UxPlay output
-                logger.debug(f"UxPlay: {line}")
+                event = match.lastgroup
 
                 # Detect client authentication
-                match = client_name_pattern.search(line)
-                if match:
-                    current_client = match.group(1)
+                if event == 'auth':
+                    current_client = match.group('client').decode('utf-8', 'replace')
                     logger.info(f"✓ iOS device authenticated: {current_client}")
 
                 # Detect mirroring start
-                if connection_pattern.search(line):
+                elif event == 'start':
                     if current_client:
                         client_id = f"uxplay_{current_client}_{int(time.time())}"
                         logger.info(f"✓ Screen mirroring started: {current_client}")
@@ -337,7 +424,7 @@ class UxPlayIntegration:
                         # Store client info
                         self.active_clients[current_client] = {
                             'client_id': client_id,
-                            'connected_at': time.time(),
+                            'connected_at': time.monotonic_ns(),
                         }
 
                         # In basic mode, start placeholder updates
@@ -349,7 +436,7 @@ class UxPlayIntegration:
                             ).start()
 
                 # Detect disconnection
-                if disconnect_pattern.search(line):
+                elif event == 'stop':
                     logger.info(f"✓ Screen mirroring stopped: {current_client if current_client else 'device'}")
                     if current_client and current_client in self.active_clients:
                         client_id = self.active_clients[current_client]['client_id']
@@ -363,86 +450,99 @@ class UxPlayIntegration:
         finally:
             logger.info("UxPlay monitor thread stopped")
 
+    def _output_lines(self):
+        """
+        Yield UxPlay's non-empty output lines as stripped bytes
+
+        Output is read in chunks of whatever is available rather than one
+        decoded line per read.
+        """
+        pending = b''
+        while self.running and self.process:
+            chunk = self.process.stdout.read1(_UXPLAY_READ_SIZE)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b'\n')
+            for line in lines:
+                line = line.strip()
+                if line:
+                    yield line
+        pending = pending.strip()
+        if pending:
+            yield pending
+
     def _update_placeholder_frames(self, client_id: str, device_name: str):
         """Update placeholder frames (for basic mode)"""
         frame_count = 0
 
+        # Only the status line changes, so the rest is rendered once
+        base = self._create_placeholder_frame(device_name, status=None)
+
         try:
             while self.running and device_name in self.active_clients:
-                frame = self._create_placeholder_frame(
-                    device_name,
+                frame = base.copy()
+                self._draw_placeholder_status(
+                    frame,
                     f"Connected • No video capture • Frame {frame_count}"
                 )
 
                 self.stream_manager.update_stream(client_id, frame)
 
                 frame_count += 1
-                time.sleep(0.5)  # 2 FPS for placeholders
+                time.sleep(1.0)  # 1 FPS for placeholders
 
         except Exception as e:
             logger.error(f"Error updating placeholder frames: {e}")
 
     def _create_connecting_frame(self, device_name: str) -> np.ndarray:
         """Create a 'connecting' frame"""
-        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
-
         # Blue gradient background
-        for y in range(720):
-            ratio = y / 720
-            b = int(120 + ratio * 80)
-            g = int(80 + ratio * 40)
-            r = int(40 + ratio * 20)
-            frame[y, :] = [b, g, r]
+        frame = _gradient_background((120, 80, 40), (80, 40, 20)).copy()
 
         font = cv2.FONT_HERSHEY_SIMPLEX
 
         # Title
         text1 = f"iOS: {device_name}"
-        text_size = cv2.getTextSize(text1, font, 1.8, 3)[0]
-        text_x = (1280 - text_size[0]) // 2
+        text_x = _centered_text_x(text1, 1.8, 3)
         cv2.putText(frame, text1, (text_x, 300), font, 1.8, (255, 255, 255), 3)
 
         # Status
         text2 = "Connecting to video stream..."
-        text_size2 = cv2.getTextSize(text2, font, 1.0, 2)[0]
-        text_x2 = (1280 - text_size2[0]) // 2
+        text_x2 = _centered_text_x(text2, 1.0, 2)
         cv2.putText(frame, text2, (text_x2, 380), font, 1.0, (150, 255, 150), 2)
 
         return frame
 
-    def _create_placeholder_frame(self, device_name: str, status: str = "Connected") -> np.ndarray:
-        """Create a placeholder frame (for basic mode)"""
-        frame = np.zeros((720, 1280, 3), dtype=np.uint8)
-
+    def _create_placeholder_frame(self, device_name: str, status: Optional[str] = "Connected") -> np.ndarray:
+        """Create a placeholder frame (for basic mode), without a status line if status is None"""
         # Purple gradient background
-        for y in range(720):
-            ratio = y / 720
-            r = int(60 + ratio * 100)
-            g = int(40 + ratio * 30)
-            b = int(80 + ratio * 120)
-            frame[y, :] = [b, g, r]
+        frame = _gradient_background((80, 40, 60), (120, 30, 100)).copy()
 
         font = cv2.FONT_HERSHEY_SIMPLEX
 
         # Title
         text1 = f"UxPlay: {device_name}"
-        text_size = cv2.getTextSize(text1, font, 1.5, 3)[0]
-        text_x = (1280 - text_size[0]) // 2
+        text_x = _centered_text_x(text1, 1.5, 3)
         cv2.putText(frame, text1, (text_x, 280), font, 1.5, (255, 255, 255), 3)
 
         # Status
-        text_size2 = cv2.getTextSize(status, font, 0.9, 2)[0]
-        text_x2 = (1280 - text_size2[0]) // 2
-        cv2.putText(frame, status, (text_x2, 350), font, 0.9, (100, 255, 100), 2)
+        if status is not None:
+            self._draw_placeholder_status(frame, status)
 
         # Warning message
         warning = "Video capture not available - install GStreamer for real frames"
-        text_size3 = cv2.getTextSize(warning, font, 0.5, 1)[0]
-        text_x3 = (1280 - text_size3[0]) // 2
+        text_x3 = _centered_text_x(warning, 0.5, 1)
         cv2.putText(frame, warning, (text_x3, 420), font, 0.5, (200, 200, 200), 1)
 
         return frame
 
+    @staticmethod
+    def _draw_placeholder_status(frame: np.ndarray, status: str):
+        """Draw the status line of a placeholder frame"""
+        # The status changes every tick, so it is measured without the cache
+        text_x = _text_x(status, 0.9, 2)
+        cv2.putText(frame, status, (text_x, 350), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (100, 255, 100), 2)
+
     def get_status(self) -> dict:
         """Get current status"""
         return {
@@ -266,10 +266,8 @@ class StreamViewer:
         frame = tk.Frame(container, bg="#2d2d2d", relief=tk.RAISED, borderwidth=2, cursor="hand2")
         frame.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
 
-        # Get stream data
-        streams = stream_manager.get_all_streams()
-        stream_data = streams.get(client_id, {})
-        name = stream_data.get('name', 'Unknown')
+        # Get stream name
+        name = stream_manager.get_stream_names().get(client_id, 'Unknown')
 
         # Name label
         name_label = tk.Label(
@@ -302,8 +300,7 @@ class StreamViewer:
         self.expanded_label = None
 
         # Rebuild the grid with current streams
-        streams = stream_manager.get_all_streams()
-        client_ids = sorted(streams.keys())
+        client_ids = sorted(stream_manager.get_stream_names())
         self.create_stream_grid(client_ids)
 
     def toggle_server(self):
@@ -394,9 +391,10 @@ class StreamViewer:
             return
 
         try:
-            streams = stream_manager.get_all_streams()
-            active_count = len(streams)
-            client_ids = sorted(streams.keys())
+            # Frames are fetched (and converted) only for the streams shown
+            names = stream_manager.get_stream_names()
+            active_count = len(names)
+            client_ids = sorted(names)
 
             # Update count label
             self.count_label.config(text=f"Active Streams: {active_count}")
@@ -408,13 +406,12 @@ class StreamViewer:
             # If in expanded view, update only the expanded stream
             if self.expanded_client_id:
                 # Check if expanded stream still exists
-                if self.expanded_client_id not in streams:
+                if self.expanded_client_id not in names:
                     # Stream disconnected, collapse back to grid
                     self.collapse_stream()
                 else:
                     # Update the expanded view
-                    stream_data = streams[self.expanded_client_id]
-                    frame = stream_data['frame']
+                    frame = stream_manager.get_bgr(self.expanded_client_id)
 
                     if frame is not None and self.expanded_label:
                         # Resize frame to fit label
@@ -442,9 +439,8 @@ class StreamViewer:
                 # Grid view - update all streams
                 for client_id in client_ids:
                     if client_id in self.stream_labels:
-                        stream_data = streams[client_id]
-                        frame = stream_data['frame']
-                        name = stream_data['name']
+                        frame = stream_manager.get_bgr(client_id)
+                        name = names[client_id]
 
                         if frame is not None:
                             # Resize frame to fit label